@@ -0,0 +1,78 @@
+import hashlib
+import zlib
+from typing import Any, Dict, Iterable, List
+
+from pymongo import UpdateOne
+
+from config import CONTENT_BLOB_COMPRESS_LEVEL
+from database import get_content_blobs_collection, get_original_files_collection
+
+# -----------------------------------------------------------------------------
+# Content-Addressed Blob Storage
+# -----------------------------------------------------------------------------
+
+def content_hash(content: str) -> str:
+    """Return the sha256 hex digest used as the blob key for a file's content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+async def store_blobs(contents: Dict[str, str]) -> int:
+    """Store compressed contents keyed by hash, skipping blobs that already exist.
+
+    Returns the number of newly stored blobs.
+    """
+    if not contents:
+        return 0
+
+    collection = get_content_blobs_collection()
+
+    # 이미 저장된 blob은 압축/전송 없이 건너뛰기
+    existing = await collection.find({"_id": {"$in": list(contents)}}, {"_id": 1}).to_list(None)
+    missing = contents.keys() - {doc["_id"] for doc in existing}
+    if not missing:
+        return 0
+
+    # $setOnInsert upsert라서 동시에 같은 blob을 저장해도 안전
+    result = await collection.bulk_write([
+        UpdateOne(
+            {"_id": h},
+            {"$setOnInsert": {"blob": zlib.compress(contents[h].encode("utf-8"), CONTENT_BLOB_COMPRESS_LEVEL)}},
+            upsert=True
+        )
+        for h in missing
+    ], ordered=False)
+    return result.upserted_count
+
+async def delete_unreferenced_blobs(hashes: Iterable[str]) -> int:
+    """Delete the given blobs unless some original file still references them.
+
+    Returns the number of deleted blobs.
+    """
+    hashes = {h for h in hashes if h}
+    if not hashes:
+        return 0
+
+    # 다른 파일/프로젝트가 같은 내용을 공유할 수 있으므로 참조가 남은 blob은 유지
+    referenced = await get_original_files_collection().distinct("content_hash", {"content_hash": {"$in": list(hashes)}})
+    unreferenced = hashes - set(referenced)
+    if not unreferenced:
+        return 0
+
+    result = await get_content_blobs_collection().delete_many({"_id": {"$in": list(unreferenced)}})
+    return result.deleted_count
+
+async def attach_contents(docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill in "content" for file documents that only reference a blob by content_hash.
+
+    Documents written before content-addressed storage keep their inline content.
+    """
+    hashes = {doc["content_hash"] for doc in docs if "content" not in doc and doc.get("content_hash")}
+    if not hashes:
+        return docs
+
+    cursor = get_content_blobs_collection().find({"_id": {"$in": list(hashes)}})
+    blobs = {blob["_id"]: zlib.decompress(blob["blob"]).decode("utf-8") async for blob in cursor}
+
+    for doc in docs:
+        if "content" not in doc and doc.get("content_hash") in blobs:
+            doc["content"] = blobs[doc["content_hash"]]
+    return docs
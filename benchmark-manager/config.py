@@ -23,6 +23,10 @@ DB_NAME = "manage_db"
 PROJECTS_COLLECTION = "projects"
 ORIGINAL_FILES_COLLECTION = "original_files"
 MODIFIED_FILES_COLLECTION = "modified_files"
+CONTENT_BLOBS_COLLECTION = "content_blobs"  # zlib-compressed file contents keyed by sha256
+
+# Documents fetched per cursor round trip for list reads
+CURSOR_BATCH_SIZE = 1000
 
 # GitHub Configuration
 DEFAULT_CONFIG_FOLDER = "config"
@@ -32,6 +36,43 @@ GITHUB_API_BASE = "https://api.github.com"
 # Polling Configuration
 DEFAULT_POLLING_INTERVAL = 86400  # 24 hours in seconds
 
+# Sync Configuration
+SYNC_ALL_MAX_CONCURRENT_PROJECTS = 4  # projects synced at once by /projects/sync-all
+SYNC_STREAM_DISCONNECT_CHECK_INTERVAL = 1.0  # seconds between client disconnect checks in /projects/sync-all/stream
+SYNC_WRITE_BATCH_SIZE = 500  # write operations per bulk_write during a sync
+SYNC_MAX_CONCURRENT_WRITES = 8  # bulk_write batches in flight at once
+SYNC_BACKOFF_BASE = 5  # seconds, multiplied by min(2 ** failures, SYNC_BACKOFF_MAX_FACTOR)
+SYNC_BACKOFF_MAX_FACTOR = 64
+
 # File Types
 SUPPORTED_CONFIG_EXTENSIONS = ['.yaml', '.yml', '.json']
-SUPPORTED_JOB_EXTENSIONS = ['.yaml', '.yml'] 
+SUPPORTED_JOB_EXTENSIONS = ['.yaml', '.yml']
+SUPPORTED_CONFIG_EXTENSIONS_TUPLE = tuple(SUPPORTED_CONFIG_EXTENSIONS)
+SUPPORTED_JOB_EXTENSIONS_TUPLE = tuple(SUPPORTED_JOB_EXTENSIONS)
+# Extension -> file type for benchmark folders (job extensions take precedence over config)
+FILE_TYPE_BY_EXTENSION = {
+    **{ext: "config" for ext in SUPPORTED_CONFIG_EXTENSIONS},
+    **{ext: "job" for ext in SUPPORTED_JOB_EXTENSIONS}
+}
+
+# HTTP Client Configuration (shared aiohttp connection pool)
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 64
+HTTP_DNS_CACHE_TTL = 300  # seconds
+HTTP_KEEPALIVE_TIMEOUT = 75  # seconds
+GITHUB_MAX_CONCURRENT_REQUESTS = HTTP_CONNECTION_LIMIT_PER_HOST  # per GitHub client
+
+# GitHub Retry Configuration (429 / secondary rate limit / 5xx)
+GITHUB_MAX_RETRIES = 5
+GITHUB_RETRY_MAX_BACKOFF = 30  # seconds, cap for exponential backoff
+GITHUB_RETRY_MAX_WAIT = 60  # seconds, give up instead of waiting longer for a rate-limit reset
+GITHUB_ERROR_BODY_LIMIT = 1024  # bytes of an error response body kept for logging
+
+# Content Blob Configuration
+CONTENT_BLOB_COMPRESS_LEVEL = 6  # zlib level for stored file contents
+
+# Blob Cache Configuration (decoded file contents keyed by git blob sha)
+BLOB_CACHE_MAX_ENTRIES = 4096
+
+# Folder Listing Cache Configuration (ETag + contents per folder URL)
+FOLDER_CACHE_MAX_ENTRIES = 1024
@@ -1,10 +1,13 @@
 import motor.motor_asyncio
 from pymongo.errors import ConnectionFailure
-from pymongo import ReadPreference
+from pymongo import ReadPreference, IndexModel
 import logging
 from typing import Optional
 
-from config import MONGO_URL, DB_NAME, PROJECTS_COLLECTION, ORIGINAL_FILES_COLLECTION, MODIFIED_FILES_COLLECTION
+from config import (
+    MONGO_URL, DB_NAME, PROJECTS_COLLECTION, ORIGINAL_FILES_COLLECTION, MODIFIED_FILES_COLLECTION,
+    CONTENT_BLOBS_COLLECTION
+)
 
 # -----------------------------------------------------------------------------
 # Database Connection
@@ -22,6 +25,7 @@ async def connect_to_mongo():
         db.client = motor.motor_asyncio.AsyncIOMotorClient(
             MONGO_URL,
             read_preference=ReadPreference.SECONDARY_PREFERRED,
+            tz_aware=True,
             serverSelectionTimeoutMS=60000,
             connectTimeoutMS=60000
         )
@@ -49,22 +53,34 @@ async def create_indexes():
     """Create database indexes for better performance."""
     try:
         # Projects collection indexes
-        await db.db[PROJECTS_COLLECTION].create_index([("project_id", 1)], unique=True)
-        await db.db[PROJECTS_COLLECTION].create_index([("name", 1)])
+        await db.db[PROJECTS_COLLECTION].create_indexes([
+            IndexModel([("project_id", 1)], unique=True),
+            IndexModel([("name", 1)])
+        ])
         
         # Original files collection indexes
-        await db.db[ORIGINAL_FILES_COLLECTION].create_index([("file_id", 1)], unique=True)
-        await db.db[ORIGINAL_FILES_COLLECTION].create_index([("project_id", 1)])
-        await db.db[ORIGINAL_FILES_COLLECTION].create_index([("file_path", 1)])
-        await db.db[ORIGINAL_FILES_COLLECTION].create_index([("file_type", 1)])
-        await db.db[ORIGINAL_FILES_COLLECTION].create_index([("project_id", 1), ("file_path", 1)], unique=True)
+        await db.db[ORIGINAL_FILES_COLLECTION].create_indexes([
+            IndexModel([("file_id", 1)], unique=True),
+            IndexModel([("project_id", 1)]),
+            IndexModel([("file_path", 1)]),
+            IndexModel([("file_type", 1)]),
+            IndexModel([("project_id", 1), ("file_path", 1)], unique=True),
+            IndexModel([("project_id", 1), ("file_type", 1)]),
+            # sync 시 기존 파일 비교 조회(file_path, file_id, sha, etag)를 인덱스만으로 처리
+            IndexModel([("project_id", 1), ("file_path", 1), ("file_id", 1), ("sha", 1), ("etag", 1)]),
+            # 사용하지 않는 blob 정리 시 참조 여부 확인
+            IndexModel([("content_hash", 1)], sparse=True)
+        ])
         
         # Modified files collection indexes
-        await db.db[MODIFIED_FILES_COLLECTION].create_index([("file_id", 1)], unique=True, sparse=True)
-        await db.db[MODIFIED_FILES_COLLECTION].create_index([("project_id", 1)])
-        await db.db[MODIFIED_FILES_COLLECTION].create_index([("file_path", 1)])
-        await db.db[MODIFIED_FILES_COLLECTION].create_index([("file_type", 1)])
-        await db.db[MODIFIED_FILES_COLLECTION].create_index([("project_id", 1), ("file_path", 1)])
+        await db.db[MODIFIED_FILES_COLLECTION].create_indexes([
+            IndexModel([("file_id", 1)], unique=True, sparse=True),
+            IndexModel([("project_id", 1)]),
+            IndexModel([("file_path", 1)]),
+            IndexModel([("file_type", 1)]),
+            IndexModel([("project_id", 1), ("file_path", 1)]),
+            IndexModel([("project_id", 1), ("file_type", 1)])
+        ])
         
         logging.info("All indexes created successfully.")
         
@@ -89,4 +105,8 @@ def get_modified_files_collection():
     """Get modified files collection."""
     return db.db[MODIFIED_FILES_COLLECTION]
 
+def get_content_blobs_collection():
+    """Get content blobs collection."""
+    return db.db[CONTENT_BLOBS_COLLECTION]
+
  
\ No newline at end of file
@@ -1,11 +1,19 @@
+import asyncio
 import logging
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import uuid4
 
 from database import get_modified_files_collection, get_original_files_collection
+from blob_store import attach_contents
+from pydantic import TypeAdapter
+
 from models import ModifiedFile, OriginalFile
 
+# Built once per process and reused for every validation
+ORIGINAL_FILE_ADAPTER = TypeAdapter(OriginalFile)
+MODIFIED_FILE_ADAPTER = TypeAdapter(ModifiedFile)
+
 # -----------------------------------------------------------------------------
 # Modified Files Management
 # -----------------------------------------------------------------------------
@@ -14,8 +22,8 @@ async def create_modified_file(project_id: str, file_data: ModifiedFile) -> Modi
     """Create a new modified file."""
     collection = get_modified_files_collection()
     
-    file_id = str(uuid4())
-    now = datetime.now()
+    file_id = uuid4().hex
+    now = datetime.now(timezone.utc)
     
     modified_doc = {
         "file_id": file_id,
@@ -30,7 +38,7 @@ async def create_modified_file(project_id: str, file_data: ModifiedFile) -> Modi
     
     await collection.insert_one(modified_doc)
     
-    return ModifiedFile(**modified_doc)
+    return MODIFIED_FILE_ADAPTER.validate_python(modified_doc)
 
 async def get_modified_file(file_id: str) -> Optional[ModifiedFile]:
     """Get a modified file by ID."""
@@ -38,22 +46,20 @@ async def get_modified_file(file_id: str) -> Optional[ModifiedFile]:
     file_doc = await collection.find_one({"file_id": file_id}, {"_id": 0})
     
     if file_doc:
-        return ModifiedFile(**file_doc)
+        return MODIFIED_FILE_ADAPTER.validate_python(file_doc)
     return None
 
 async def update_modified_file(file_id: str, update_data: ModifiedFile) -> Optional[ModifiedFile]:
     """Update a modified file."""
     collection = get_modified_files_collection()
     
-    update_dict = {}
-    for field, value in update_data.dict(exclude_unset=True).items():
-        if value is not None and field != "file_id":  # Don't update file_id
-            update_dict[field] = value
+    # Don't update file_id
+    update_dict = update_data.model_dump(exclude_unset=True, exclude_none=True, exclude={"file_id"})
     
     if not update_dict:
         return await get_modified_file(file_id)
     
-    update_dict["modified_at"] = datetime.now()
+    update_dict["modified_at"] = datetime.now(timezone.utc)
     
     result = await collection.update_one(
         {"file_id": file_id},
@@ -94,7 +100,8 @@ async def get_original_file_by_id(file_id: str) -> Optional[OriginalFile]:
     file_doc = await collection.find_one({"file_id": file_id}, {"_id": 0})
     
     if file_doc:
-        return OriginalFile(**file_doc)
+        await attach_contents([file_doc])
+        return ORIGINAL_FILE_ADAPTER.validate_python(file_doc)
     return None
 
 # -----------------------------------------------------------------------------
@@ -126,36 +133,26 @@ async def get_all_project_files(project_id: str):
     original_files_collection = get_original_files_collection()
     modified_files_collection = get_modified_files_collection()
     
+    # original / modified 파일을 동시에 조회
+    original_docs, modified_docs = await asyncio.gather(
+        original_files_collection.find({"project_id": project_id}, {"_id": 0}).to_list(None),
+        modified_files_collection.find({"project_id": project_id}, {"_id": 0}).to_list(None)
+    )
+    await attach_contents(original_docs)
+    
     all_files = []
     
-    # Get original files
-    original_cursor = original_files_collection.find({"project_id": project_id}, {"_id": 0})
-    
-    async for doc in original_cursor:
-        file_data = dict(doc)
-        file_data["source"] = "original"  # Mark as original file
-        
-        # file_path에서 benchmark_type과 file_name 추출
-        file_path = file_data.get("file_path", "")
-        path_parts = file_path.split("/")
-        file_data["benchmark_type"] = path_parts[-2] if len(path_parts) > 1 else ""
-        file_data["file_name"] = path_parts[-1] if path_parts else file_path
-        
-        all_files.append(file_data)
-    
-    # Get modified files
-    modified_cursor = modified_files_collection.find({"project_id": project_id}, {"_id": 0})
-    
-    async for doc in modified_cursor:
-        file_data = dict(doc)
-        file_data["source"] = "modified"  # Mark as modified file
-        
-        # file_path에서 benchmark_type과 file_name 추출
-        file_path = file_data.get("file_path", "")
-        path_parts = file_path.split("/")
-        file_data["benchmark_type"] = path_parts[-2] if len(path_parts) > 1 else ""
-        file_data["file_name"] = path_parts[-1] if path_parts else file_path
-        
-        all_files.append(file_data)
-    
-    return all_files 
\ No newline at end of file
+    for source, docs in (("original", original_docs), ("modified", modified_docs)):
+        for doc in docs:
+            file_data = dict(doc)
+            file_data["source"] = source  # Mark as original / modified file
+            
+            # file_path에서 benchmark_type과 file_name 추출
+            file_path = file_data.get("file_path", "")
+            path_parts = file_path.split("/")
+            file_data["benchmark_type"] = path_parts[-2] if len(path_parts) > 1 else ""
+            file_data["file_name"] = path_parts[-1] if path_parts else file_path
+            
+            all_files.append(file_data)
+    
+    return all_files
@@ -1,245 +1,548 @@
 import aiohttp
+import asyncio
 import base64
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import orjson
+import random
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
+from datetime import datetime, timezone
 
-from config import GITHUB_API_BASE, SUPPORTED_CONFIG_EXTENSIONS, SUPPORTED_JOB_EXTENSIONS
+from config import (
+    GITHUB_API_BASE, SUPPORTED_CONFIG_EXTENSIONS_TUPLE, SUPPORTED_JOB_EXTENSIONS_TUPLE, FILE_TYPE_BY_EXTENSION,
+    HTTP_CONNECTION_LIMIT, HTTP_CONNECTION_LIMIT_PER_HOST, HTTP_DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT,
+    GITHUB_MAX_CONCURRENT_REQUESTS, GITHUB_MAX_RETRIES, GITHUB_RETRY_MAX_BACKOFF, GITHUB_RETRY_MAX_WAIT,
+    GITHUB_ERROR_BODY_LIMIT, BLOB_CACHE_MAX_ENTRIES, FOLDER_CACHE_MAX_ENTRIES
+)
+
+# -----------------------------------------------------------------------------
+# Shared HTTP Session
+# -----------------------------------------------------------------------------
+
+class HTTPSession:
+    session: Optional[aiohttp.ClientSession] = None
+
+http = HTTPSession()
+
+# Token-independent headers, set once on the shared session
+DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "benchmark-manager-service"
+}
+
+# Folder listing cache for conditional GETs: url -> {"etag", "contents"}
+# Bounded like blob_cache so folders of deleted projects or old paths do not pile up.
+folder_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def get_cached_folder(url: str) -> Optional[Dict[str, Any]]:
+    """Return the cached listing for a folder URL, marking it as recently used."""
+    cached = folder_cache.get(url)
+    if cached is not None:
+        folder_cache.move_to_end(url)
+    return cached
+
+def cache_folder(url: str, etag: str, contents: List[Dict[str, Any]]):
+    """Store a folder listing, evicting the least recently used entry when full."""
+    folder_cache[url] = {"etag": etag, "contents": contents}
+    folder_cache.move_to_end(url)
+    if len(folder_cache) > FOLDER_CACHE_MAX_ENTRIES:
+        folder_cache.popitem(last=False)
+
+# Decoded file contents keyed by git blob sha, shared by all clients.
+# Blob content is immutable per sha, so entries never need invalidation.
+blob_cache: "OrderedDict[str, str]" = OrderedDict()
+
+def get_cached_blob(sha: str) -> Optional[str]:
+    """Return cached content for a blob sha, marking it as recently used."""
+    content = blob_cache.get(sha)
+    if content is not None:
+        blob_cache.move_to_end(sha)
+    return content
+
+def cache_blob(sha: str, content: str):
+    """Store blob content, evicting the least recently used entry when full."""
+    blob_cache[sha] = content
+    blob_cache.move_to_end(sha)
+    if len(blob_cache) > BLOB_CACHE_MAX_ENTRIES:
+        blob_cache.popitem(last=False)
+
+async def open_http_session():
+    """Create the shared aiohttp session used by all GitHub clients."""
+    if http.session is None or http.session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+        )
+        http.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        )
+        logging.info("Shared HTTP session opened.")
+    return http.session
+
+async def close_http_session():
+    """Close the shared aiohttp session."""
+    if http.session and not http.session.closed:
+        await http.session.close()
+        logging.info("Shared HTTP session closed.")
+    http.session = None
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Parse a response body with orjson."""
+    return orjson.loads(await response.read())
 
 # -----------------------------------------------------------------------------
 # GitHub API Client
 # -----------------------------------------------------------------------------
 
 class GitHubClient:
-    def __init__(self, repo_url: str, token: str):
+    def __init__(self, repo_url: str, token: str, file_cache: Optional[Dict[str, Dict[str, Any]]] = None):
         self.repo_url = repo_url
         self.token = token
-        self.headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "benchmark-manager-service"
-        }
-        if token:
-            self.headers["Authorization"] = f"token {token}"
+        # file_path -> {"etag", "sha"[, "content"]} from the previous sync, used for conditional GETs.
+        # Without "content", unchanged files come back with content None; the caller already has them.
+        self.file_cache = file_cache or {}
+        # Caps in-flight GitHub requests per client to match the per-host connection limit
+        self._sem = asyncio.Semaphore(GITHUB_MAX_CONCURRENT_REQUESTS)
+        # Per-client headers sent on top of the session's DEFAULT_HEADERS
+        self.headers = {"Authorization": f"token {token}"} if token else {}
+        self.raw_headers = {**self.headers, "Accept": "application/vnd.github.raw"}
+        # Set when any listing or file fetch did not return, so the result is only a partial view of the repo.
+        # Callers must not treat files missing from a partial result as deleted.
+        self.incomplete = False
+        # Set when a fetch failed because of an error (as opposed to a file removed by a concurrent push)
+        self.failed = False
+
+    def _mark_failed(self):
+        """Record that a GitHub request errored, leaving this sync's result incomplete."""
+        self.incomplete = True
+        self.failed = True
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening it lazily if startup did not."""
+        if http.session is None or http.session.closed:
+            return await open_http_session()
+        return http.session
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+        """Return how long to wait before retrying a response, or None if it is not retryable."""
+        status = response.status
+        rate_limited = (
+            status == 429 or
+            (status == 403 and (response.headers.get("X-RateLimit-Remaining") == "0" or
+                                "Retry-After" in response.headers))
+        )
+        if not rate_limited and status < 500:
+            return None
+        
+        delay = min(GITHUB_RETRY_MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 0.5)
+        if rate_limited:
+            retry_after = response.headers.get("Retry-After")
+            reset = response.headers.get("X-RateLimit-Reset")
+            if retry_after and retry_after.isdigit():
+                delay = max(int(retry_after), delay)
+            elif reset and reset.isdigit():
+                delay = max(int(reset) - time.time(), delay)
+        return delay
+
+    async def _get_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                        as_text: bool = False) -> Tuple[int, Any, Any]:
+        """GET a GitHub API URL, retrying rate limits and 5xx with exponential backoff.
+        
+        Returns (status, response headers, body) where body is the parsed JSON
+        (or text when as_text is set) on 200, the first GITHUB_ERROR_BODY_LIMIT
+        bytes of the error body on other 4xx/5xx statuses and None otherwise.
+        Network errors are re-raised once the retry budget is exhausted.
+        """
+        session = await self._get_session()
+        for attempt in range(GITHUB_MAX_RETRIES + 1):
+            try:
+                async with session.get(url, headers=self.headers if headers is None else headers) as response:
+                    if response.status == 200:
+                        body = await response.text() if as_text else await read_json(response)
+                        return response.status, response.headers, body
+                    
+                    delay = self._retry_delay(response, attempt) if attempt < GITHUB_MAX_RETRIES else None
+                    if delay is None or delay > GITHUB_RETRY_MAX_WAIT:
+                        body = None
+                        if response.status >= 400:
+                            body = (await response.content.read(GITHUB_ERROR_BODY_LIMIT)).decode('utf-8', 'replace')
+                            # Hand the connection back right away; it stays pooled when the body was consumed
+                            response.release()
+                        return response.status, response.headers, body
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= GITHUB_MAX_RETRIES:
+                    raise
+                delay = min(GITHUB_RETRY_MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 0.5)
+                status = type(e).__name__
+            
+            logging.warning(f"GitHub request failed ({status}), retrying in {delay:.1f}s: {url}")
+            await asyncio.sleep(delay)
+
+    async def _fetch_folder_guarded(self, folder_path: str) -> List[Dict[str, Any]]:
+        """Fetch folder contents under the client's concurrency limit."""
+        async with self._sem:
+            return await self.fetch_folder_contents(folder_path)
+
+    async def _fetch_file_guarded(self, file_path: str, sha: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Fetch file content under the client's concurrency limit."""
+        async with self._sem:
+            return await self.fetch_file_content(file_path, sha)
 
     async def fetch_folder_contents(self, folder_path: str) -> List[Dict[str, Any]]:
         """Fetch contents of a folder from GitHub repository."""
         try:
             url = f"{self.repo_url}/contents/{folder_path}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        contents = await response.json()
-                        result = contents if isinstance(contents, list) else []
-                        return result
-                    elif response.status == 404:
-                        logging.warning(f"Folder not found: /{folder_path}")
-                        return []
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Failed to fetch {folder_path}: {response.status} - {error_text}")
-                        return []
+            headers = self.headers
+            cached = get_cached_folder(url)
+            if cached:
+                headers = {**self.headers, "If-None-Match": cached["etag"]}
+            
+            status, response_headers, body = await self._get_json(url, headers)
+            if status == 304:
+                return cached["contents"]
+            elif status == 200:
+                result = body if isinstance(body, list) else []
+                etag = response_headers.get("ETag")
+                if etag:
+                    cache_folder(url, etag, result)
+                return result
+            elif status == 404:
+                folder_cache.pop(url, None)
+                logging.warning(f"Folder not found: /{folder_path}")
+                return []
+            else:
+                logging.error(f"Failed to fetch {folder_path}: {status} - {body}")
+                self._mark_failed()
+                return []
         except Exception as e:
             logging.error(f"Error fetching folder contents for {folder_path}: {e}")
+            self._mark_failed()
             return []
 
-    async def fetch_file_content(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Fetch content of a specific file from GitHub repository."""
+    async def fetch_file_content(self, file_path: str, sha: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Fetch content of a specific file from GitHub repository.
+        
+        Sends If-None-Match when the previous sync stored an ETag for the path,
+        so unchanged files come back as 304 and reuse the cached content.
+        When the blob sha is already known from a folder or tree listing, the
+        file is requested with the raw media type to skip JSON and base64, or
+        served from the shared blob cache without any request.
+        """
         try:
             url = f"{self.repo_url}/contents/{file_path}"
+            cached = self.file_cache.get(file_path)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        file_info = await response.json()
-                        if file_info.get("type") == "file":
-                            # Decode base64 content
-                            content = base64.b64decode(file_info["content"]).decode('utf-8')
-                            return {
-                                "path": file_path,
-                                "content": content,
-                                "sha": file_info["sha"],
-                                "last_modified": datetime.now().isoformat()
-                            }
-                    else:
-                        logging.error(f"Failed to fetch file {file_path}: {response.status}")
-                        return None
+            if sha is not None:
+                content = get_cached_blob(sha)
+                if content is not None:
+                    return {
+                        "path": file_path,
+                        "content": content,
+                        "sha": sha,
+                        "etag": cached.get("etag") if cached and cached.get("sha") == sha else None
+                    }
+            
+            raw = sha is not None
+            headers = self.raw_headers if raw else self.headers
+            if cached and cached.get("etag"):
+                headers = {**headers, "If-None-Match": cached["etag"]}
+            
+            status, response_headers, file_info = await self._get_json(url, headers, as_text=raw)
+            if raw and status == 406:
+                # Raw media type rejected, fall back to the JSON + base64 representation
+                return await self.fetch_file_content(file_path)
+            if status == 304:
+                return {
+                    "path": file_path,
+                    "content": cached.get("content"),
+                    "sha": cached["sha"],
+                    "etag": cached["etag"]
+                }
+            elif status == 200 and raw:
+                # The raw fetch reads the path at the current head, which may have moved since the
+                # listing; key the blob by the sha of the bytes actually returned, not the listed sha
+                actual_sha = git_blob_sha(file_info)
+                if actual_sha != sha:
+                    logging.info(f"File {file_path} changed since it was listed ({sha} -> {actual_sha})")
+                cache_blob(actual_sha, file_info)
+                return {
+                    "path": file_path,
+                    "content": file_info,
+                    "sha": actual_sha,
+                    "etag": response_headers.get("ETag")
+                }
+            elif status == 200:
+                if file_info.get("type") == "file":
+                    # Decode base64 content
+                    content = base64.b64decode(file_info["content"]).decode('utf-8')
+                    cache_blob(file_info["sha"], content)
+                    return {
+                        "path": file_path,
+                        "content": content,
+                        "sha": file_info["sha"],
+                        "etag": response_headers.get("ETag")
+                    }
+            elif status == 404:
+                # Listed but removed by a push since the listing: not an error, the next sync sees the new tree
+                logging.warning(f"File {file_path} disappeared since it was listed")
+                self.incomplete = True
+                return None
+            logging.error(f"Failed to fetch file {file_path}: {status}")
         except Exception as e:
             logging.error(f"Error fetching file content for {file_path}: {e}")
-            return None
+        self._mark_failed()
+        return None
 
-    async def fetch_config_files(self, config_folder: str) -> List[Dict[str, Any]]:
-        """Fetch all config files from the specified folder."""
+    def _reuse_cached(self, file_path: str, sha: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the previous sync's content when the listed blob sha is unchanged."""
+        cached = self.file_cache.get(file_path)
+        if cached and sha and cached.get("sha") == sha:
+            return {
+                "path": file_path,
+                "content": cached.get("content"),
+                "sha": cached["sha"],
+                "etag": cached.get("etag")
+            }
+        return None
+
+    async def _fetch_matching(self, folder: str, file_type: str, predicate: Callable[[str], bool]) -> List[Dict[str, Any]]:
+        """Fetch every file in a folder whose name matches the predicate, in parallel."""
         files_data = []
         try:
-            contents = await self.fetch_folder_contents(config_folder)
+            contents = await self.fetch_folder_contents(folder)
+            items = [
+                item for item in contents
+                if item.get("type") == "file" and item.get("name") and predicate(item["name"])
+            ]
             
-            for item in contents:
-                if (item.get("type") == "file" and 
-                    item.get("name") and
-                    any(item["name"].endswith(ext) for ext in SUPPORTED_CONFIG_EXTENSIONS)):
+            # sha가 같은 파일은 기존 content 재사용, 나머지만 병렬로 가져오기
+            file_results = []
+            fetch_tasks = []
+            for item in items:
+                reused = self._reuse_cached(item["path"], item.get("sha"))
+                if reused:
+                    file_results.append((item, reused))
+                else:
+                    fetch_tasks.append(_with_meta(item, self._fetch_file_guarded(item["path"], item.get("sha"))))
+            file_results.extend(await asyncio.gather(*fetch_tasks))
+            
+            now = datetime.now(timezone.utc)
+            for item, file_content in file_results:
+                if isinstance(file_content, Exception):
+                    logging.error(f"Error fetching file {item['path']}: {file_content}")
+                    self._mark_failed()
+                    continue
+                if file_content:
+                    # Store original text content without parsing
+                    files_data.append({
+                        "file_path": item["path"],
+                        "file_type": file_type,
+                        "content": file_content["content"],  # Original text content
+                        "sha": file_content["sha"],
+                        "etag": file_content.get("etag"),
+                        "last_modified": now
+                    })
                     
-                    file_content = await self.fetch_file_content(item["path"])
-                    if file_content:
-                        # Store original text content without parsing
-                        files_data.append({
-                            "file_path": item["path"],
-                            "file_type": "config",
-                            "content": file_content["content"],  # Original text content
-                            "sha": file_content["sha"],
-                            "last_modified": datetime.now()
-                        })
-                            
         except Exception as e:
-            logging.error(f"Error fetching config files: {e}")
+            logging.error(f"Error fetching {file_type} files from {folder}: {e}")
+            self._mark_failed()
             
         return files_data
 
+    async def fetch_config_files(self, config_folder: str) -> List[Dict[str, Any]]:
+        """Fetch all config files from the specified folder."""
+        return await self._fetch_matching(
+            config_folder, "config", lambda name: name.endswith(SUPPORTED_CONFIG_EXTENSIONS_TUPLE)
+        )
+
     async def fetch_job_files(self, job_folder: str) -> List[Dict[str, Any]]:
         """Fetch all job files from the specified folder."""
-        files_data = []
+        return await self._fetch_matching(
+            job_folder, "job", lambda name: name.endswith(SUPPORTED_JOB_EXTENSIONS_TUPLE)
+        )
+
+    async def fetch_vllm_files(self, vllm_values_path: str) -> List[Dict[str, Any]]:
+        """Fetch all custom-values*.yaml files from the specified folder."""
+        return await self._fetch_matching(
+            vllm_values_path, "vllm", lambda name: name.startswith("custom-values") and name.endswith(".yaml")
+        )
+
+    async def fetch_head_etag(self, etag: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """Check whether the default branch moved since the ETag of a previous check.
+        
+        Requests only the HEAD commit sha, conditionally on the given ETag.
+        Returns (changed, etag); errors are reported as changed with no ETag
+        so the caller falls back to a full sync.
+        """
         try:
-            contents = await self.fetch_folder_contents(job_folder)
+            url = f"{self.repo_url}/commits/HEAD"
+            headers = {**self.headers, "Accept": "application/vnd.github.sha"}
+            if etag:
+                headers["If-None-Match"] = etag
             
-            for item in contents:
-                if (item.get("type") == "file" and 
-                    item.get("name") and
-                    any(item["name"].endswith(ext) for ext in SUPPORTED_JOB_EXTENSIONS)):
-                    
-                    file_content = await self.fetch_file_content(item["path"])
-                    if file_content:
-                        # Store original text content without parsing
-                        files_data.append({
-                            "file_path": item["path"],
-                            "file_type": "job",
-                            "content": file_content["content"],  # Original text content
-                            "sha": file_content["sha"],
-                            "last_modified": datetime.now()
-                        })
-                            
+            status, response_headers, _ = await self._get_json(url, headers, as_text=True)
+            if status == 304:
+                return False, etag
+            if status == 200:
+                return True, response_headers.get("ETag")
+            logging.warning(f"Failed to check repository head: {status}")
         except Exception as e:
-            logging.error(f"Error fetching job files: {e}")
-            
-        return files_data
+            logging.error(f"Error checking repository head: {e}")
+        return True, None
 
-    async def fetch_vllm_files(self, vllm_values_path: str) -> List[Dict[str, Any]]:
-        """Fetch all custom-values*.yaml files from the specified folder."""
-        files_data = []
+    async def fetch_tree_recursive(self, ref: str = "HEAD") -> Optional[List[Dict[str, Any]]]:
+        """Fetch every blob in the repository with a single Git Trees API call.
+        
+        Returns None when the tree cannot be listed in one response (error or
+        truncated tree) so callers can fall back to the contents API.
+        """
         try:
-            contents = await self.fetch_folder_contents(vllm_values_path)
+            url = f"{self.repo_url}/git/trees/{ref}?recursive=1"
             
-            for item in contents:
-                if (item.get("type") == "file" and 
-                    item.get("name") and
-                    item["name"].startswith("custom-values") and 
-                    item["name"].endswith(".yaml")):
-                    
-                    file_content = await self.fetch_file_content(item["path"])
-                    if file_content:
-                        # Store original text content without parsing
-                        files_data.append({
-                            "file_path": item["path"],
-                            "file_type": "vllm",
-                            "content": file_content["content"],  # Original text content
-                            "sha": file_content["sha"],
-                            "last_modified": datetime.now()
-                        })
-                            
+            status, _, tree_info = await self._get_json(url)
+            if status != 200:
+                logging.warning(f"Failed to fetch tree {ref}: {status}")
+                return None
+            if tree_info.get("truncated"):
+                logging.warning(f"Tree {ref} is truncated, falling back to contents API")
+                return None
+            return [item for item in tree_info.get("tree", []) if item.get("type") == "blob"]
         except Exception as e:
-            logging.error(f"Error fetching VLLM files: {e}")
+            logging.error(f"Error fetching tree {ref}: {e}")
+            return None
+
+    async def _list_benchmark_files(self, benchmark_folder: str) -> List[Dict[str, Any]]:
+        """List files directly under each benchmark type folder (<benchmark_folder>/<type>/<file>)."""
+        folder = benchmark_folder.strip("/")
+        prefix = f"{folder}/" if folder else ""
+        
+        tree = await self.fetch_tree_recursive()
+        if tree is not None:
+            file_items = []
+            for item in tree:
+                path = item["path"]
+                if not path.startswith(prefix):
+                    continue
+                parts = path[len(prefix):].split("/")
+                if len(parts) != 2:
+                    continue
+                file_items.append({
+                    "path": path,
+                    "name": parts[1],
+                    "sha": item.get("sha"),
+                    "benchmark_type": parts[0]
+                })
+            return file_items
+        
+        # 1. 지정된 폴더의 서브폴더들 조회 (벤치마크 종류별 폴더)
+        benchmark_types = await self.fetch_folder_contents(benchmark_folder)
+        benchmark_folders = [bt for bt in benchmark_types if bt.get("type") == "dir"]
+        
+        if not benchmark_folders:
+            return []
+        
+        logging.info(f"⚡ Processing {len(benchmark_folders)} benchmark folders in parallel")
+        
+        # 2. 모든 벤치마크 타입별 폴더의 내용을 병렬로 가져오기
+        folder_tasks = [self._fetch_folder_guarded(bf["path"]) for bf in benchmark_folders]
+        folder_results = await asyncio.gather(*folder_tasks, return_exceptions=True)
+        
+        file_items = []
+        for i, files_in_type in enumerate(folder_results):
+            if isinstance(files_in_type, Exception):
+                logging.error(f"Error fetching folder {benchmark_folders[i]['path']}: {files_in_type}")
+                self._mark_failed()
+                continue
             
-        return files_data
+            for file_item in files_in_type:
+                if file_item.get("type") == "file":
+                    file_items.append({
+                        "path": file_item["path"],
+                        "name": file_item.get("name", ""),
+                        "sha": file_item.get("sha"),
+                        "benchmark_type": benchmark_folders[i]["name"]
+                    })
+        return file_items
 
     async def fetch_all_files(self, benchmark_folder: str, _unused_param: str = None) -> List[Dict[str, Any]]:
         """Fetch all benchmark files from benchmark type folders with parallel processing."""
-        import asyncio
         all_files = []
         
         try:
-            # 1. 지정된 폴더의 서브폴더들 조회 (벤치마크 종류별 폴더)
-            benchmark_types = await self.fetch_folder_contents(benchmark_folder)
-            
-            # 2. 모든 벤치마크 타입별 폴더를 병렬로 처리
-            benchmark_folders = [bt for bt in benchmark_types if bt.get("type") == "dir"]
+            # 1. 벤치마크 종류별 폴더의 파일 목록 조회 (Git Trees API 1회 호출, 실패 시 contents API)
+            file_items = await self._list_benchmark_files(benchmark_folder)
             
-            if not benchmark_folders:
-                logging.warning(f"No benchmark folders found in {benchmark_folder}")
+            if not file_items:
+                logging.warning(f"No benchmark files found in {benchmark_folder}")
                 return all_files
             
-            logging.info(f"⚡ Processing {len(benchmark_folders)} benchmark folders in parallel")
+            # 2. 지원하는 파일만 (file_path, sha, file_type, benchmark_type) 튜플로 분류
+            classified = [
+                (item["path"], item.get("sha"), file_type, item["benchmark_type"])
+                for item in file_items
+                for file_type in (classify_file_type(item["name"]),)
+                if file_type is not None
+            ]
             
-            # 모든 폴더의 내용을 병렬로 가져오기
-            folder_tasks = [self.fetch_folder_contents(bf["path"]) for bf in benchmark_folders]
-            folder_results = await asyncio.gather(*folder_tasks, return_exceptions=True)
+            # 3. sha가 같은 파일은 기존 content 재사용, 변경된 파일만 병렬로 가져오기
+            #    (메타데이터를 각 작업에 묶어서 결과와 함께 반환)
+            file_results = []
+            fetch_tasks = []
+            for meta in classified:
+                file_path, sha = meta[0], meta[1]
+                reused = self._reuse_cached(file_path, sha)
+                if reused:
+                    file_results.append((meta, reused))
+                else:
+                    fetch_tasks.append(_with_meta(meta, self._fetch_file_guarded(file_path, sha)))
+            if fetch_tasks:
+                logging.info(f"⚡ Fetching {len(fetch_tasks)} files in parallel ({len(file_results)} unchanged)")
+            file_results.extend(await asyncio.gather(*fetch_tasks))
             
-            # 3. 모든 파일들을 수집하여 병렬로 content 가져오기
-            all_file_tasks = []
-            file_metadata = []
+            # 4. 결과 조합
+            now = datetime.now(timezone.utc)
+            yaml_files = []
+            config_files = []
             
-            for i, files_in_type in enumerate(folder_results):
-                if isinstance(files_in_type, Exception):
-                    logging.error(f"Error fetching folder {benchmark_folders[i]['path']}: {files_in_type}")
+            for (file_path, _, file_type, benchmark_type), file_content in file_results:
+                if isinstance(file_content, Exception):
+                    logging.error(f"Error fetching file {file_path}: {file_content}")
+                    self._mark_failed()
                     continue
                     
-                benchmark_type = benchmark_folders[i]
-                
-                for file_item in files_in_type:
-                    if file_item.get("type") == "file":
-                        file_name = file_item.get("name", "")
-                        
-                        # YAML 파일 (job) 또는 Config 파일인지 확인
-                        if any(file_name.endswith(ext) for ext in SUPPORTED_JOB_EXTENSIONS):
-                            file_type = "job"
-                        elif any(file_name.endswith(ext) for ext in SUPPORTED_CONFIG_EXTENSIONS):
-                            file_type = "config"
-                        else:
-                            continue
-                        
-                        # 파일 content 가져오기 작업 추가
-                        all_file_tasks.append(self.fetch_file_content(file_item["path"]))
-                        file_metadata.append({
-                            "file_path": file_item["path"],
-                            "file_type": file_type,
-                            "benchmark_type": benchmark_type["name"]
-                        })
-            
-            # 4. 모든 파일 content를 병렬로 가져오기
-            if all_file_tasks:
-                logging.info(f"⚡ Fetching {len(all_file_tasks)} files in parallel")
-                file_results = await asyncio.gather(*all_file_tasks, return_exceptions=True)
-                
-                # 5. 결과 조합
-                yaml_files = []
-                config_files = []
-                
-                for i, file_content in enumerate(file_results):
-                    if isinstance(file_content, Exception):
-                        logging.error(f"Error fetching file {file_metadata[i]['file_path']}: {file_content}")
-                        continue
-                        
-                    if file_content:
-                        file_data = {
-                            "file_path": file_metadata[i]["file_path"],
-                            "file_type": file_metadata[i]["file_type"],
-                            "content": file_content["content"],
-                            "sha": file_content["sha"],
-                            "last_modified": datetime.now(),
-                            "benchmark_type": file_metadata[i]["benchmark_type"]
-                        }
-                        
-                        if file_metadata[i]["file_type"] == "job":
-                            yaml_files.append(file_data)
-                        else:
-                            config_files.append(file_data)
-                
-                # 6. YAML 파일들을 먼저 추가, 그 다음 Config 파일들 추가
-                all_files.extend(yaml_files)
-                all_files.extend(config_files)
-                
-                logging.info(f"✅ Successfully fetched {len(all_files)} files ({len(yaml_files)} jobs, {len(config_files)} configs)")
+                if file_content:
+                    file_data = {
+                        "file_path": file_path,
+                        "file_type": file_type,
+                        "content": file_content["content"],
+                        "sha": file_content["sha"],
+                        "etag": file_content.get("etag"),
+                        "last_modified": now,
+                        "benchmark_type": benchmark_type
+                    }
+                    
+                    if file_type == "job":
+                        yaml_files.append(file_data)
+                    else:
+                        config_files.append(file_data)
+            
+            # 5. YAML 파일들을 먼저 추가, 그 다음 Config 파일들 추가
+            all_files.extend(yaml_files)
+            all_files.extend(config_files)
+            
+            logging.info(f"✅ Successfully fetched {len(all_files)} files ({len(yaml_files)} jobs, {len(config_files)} configs)")
                     
         except Exception as e:
             logging.error(f"Error fetching benchmark files from {benchmark_folder}: {e}")
+            self._mark_failed()
             
         return all_files
 
@@ -247,6 +550,25 @@ class GitHubClient:
 # Utility Functions
 # -----------------------------------------------------------------------------
 
-def create_github_client(repo_url: str, token: str) -> GitHubClient:
+async def _with_meta(meta: Any, coro: Awaitable[Any]) -> Tuple[Any, Any]:
+    """Await a coroutine and return (meta, result), with an exception as the result on failure."""
+    try:
+        return meta, await coro
+    except Exception as e:
+        return meta, e
+
+def git_blob_sha(content: str) -> str:
+    """Return the git blob sha1 of text content, as listed by the GitHub tree and contents APIs."""
+    data = content.encode("utf-8")
+    hasher = hashlib.sha1(b"blob %d\0" % len(data))
+    hasher.update(data)
+    return hasher.hexdigest()
+
+def classify_file_type(file_name: str) -> Optional[str]:
+    """Return "job" or "config" for a benchmark file name, or None if unsupported."""
+    dot = file_name.rfind(".")
+    return FILE_TYPE_BY_EXTENSION.get(file_name[dot:]) if dot >= 0 else None
+
+def create_github_client(repo_url: str, token: str, file_cache: Optional[Dict[str, Dict[str, Any]]] = None) -> GitHubClient:
     """Create a GitHub client instance."""
-    return GitHubClient(repo_url, token) 
\ No newline at end of file
+    return GitHubClient(repo_url, token, file_cache) 
\ No newline at end of file
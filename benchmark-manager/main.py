@@ -1,12 +1,15 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List
 
 # Import our modules
-from config import SERVER_HOST, SERVER_PORT
+from config import SERVER_HOST, SERVER_PORT, SYNC_ALL_MAX_CONCURRENT_PROJECTS, SYNC_STREAM_DISCONNECT_CHECK_INTERVAL
 from database import connect_to_mongo, close_mongo_connection
+from github_client import open_http_session, close_http_session
 from models import (
     ProjectCreate, ProjectUpdate, Project, ProjectWithStats,
     ModifiedFile,
@@ -14,7 +17,8 @@ from models import (
 )
 from project_manager import (
     create_project, get_project, list_projects, update_project, delete_project,
-    get_project_with_stats, sync_project_files, get_project_files
+    get_project_with_stats, sync_project_files, sync_project_files_bounded, get_project_files,
+    total_files_count, migrate_projects
 )
 from file_manager import (
     create_modified_file, get_modified_file,
@@ -51,11 +55,14 @@ app.add_middleware(
 async def startup_event():
     """Initialize application."""
     await connect_to_mongo()
+    await migrate_projects()
+    await open_http_session()
     logging.info("🚀 Benchmark manager started - manual sync only")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup application."""
+    await close_http_session()
     await close_mongo_connection()
     logging.info("🛑 Benchmark manager stopped")
 
@@ -69,7 +76,7 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         service="benchmark-manager",
-        timestamp=datetime.now()
+        timestamp=datetime.now(timezone.utc)
     )
 
 @app.get("/status", response_model=SystemStatus)
@@ -78,10 +85,7 @@ async def get_system_status():
     projects = await list_projects()
     total_projects = len(projects)
     
-    total_files = 0
-    for project in projects:
-        stats = (await get_project_with_stats(project.project_id)).stats
-        total_files += stats.total_original_files + stats.total_modified_files
+    total_files = await total_files_count([project.project_id for project in projects])
     
     return SystemStatus(
         service="Benchmark Manager",
@@ -144,19 +148,51 @@ async def sync_project(project_id: str):
 @app.post("/projects/sync-all", response_model=List[SyncResponse])
 async def sync_all_projects_endpoint():
     """Sync all projects in parallel."""
-    import asyncio
-    
     projects = await list_projects()
     
     if not projects:
         return []
     
-    # 모든 프로젝트를 병렬로 sync
-    sync_tasks = [sync_project_files(project.project_id) for project in projects]
+    # 모든 프로젝트를 병렬로 sync (동시 sync 프로젝트 수 제한)
+    sem = asyncio.Semaphore(SYNC_ALL_MAX_CONCURRENT_PROJECTS)
+    sync_tasks = [sync_project_files_bounded(project.project_id, sem) for project in projects]
     results = await asyncio.gather(*sync_tasks)
     
     return results
 
+@app.get("/projects/sync-all/stream")
+async def sync_all_projects_stream_endpoint(request: Request):
+    """Sync all projects in parallel, streaming each result as a Server-Sent Event.
+    
+    GET so browser EventSource clients can subscribe. Syncs that have not
+    finished are cancelled when the client disconnects.
+    """
+    projects = await list_projects()
+    
+    async def event_stream():
+        sem = asyncio.Semaphore(SYNC_ALL_MAX_CONCURRENT_PROJECTS)
+        pending = {
+            asyncio.create_task(sync_project_files_bounded(project.project_id, sem))
+            for project in projects
+        }
+        try:
+            # 완료되는 순서대로 결과 전송 (결과를 기다리는 동안 주기적으로 연결 끊김 확인)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=SYNC_STREAM_DISCONNECT_CHECK_INTERVAL, return_when=asyncio.FIRST_COMPLETED
+                )
+                if await request.is_disconnected():
+                    logging.info(f"Sync stream client disconnected, cancelling {len(pending)} pending syncs")
+                    break
+                for task in done:
+                    yield f"data: {task.result().model_dump_json()}\n\n"
+        finally:
+            # 연결이 끊기거나 generator가 닫히면 남은 sync 취소
+            for task in pending:
+                task.cancel()
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.get("/projects/{project_id}/files")
 async def get_project_files_endpoint(project_id: str, file_type: Optional[str] = None):
     """Get all files for a project."""
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List, Literal, Union, Annotated
 from datetime import datetime
 from uuid import uuid4
 
@@ -37,17 +37,22 @@ class Project(BaseModel):
     created_at: datetime
     updated_at: datetime
     last_sync: Optional[datetime] = None
+    repo_etag: Optional[str] = None
+    consecutive_failures: int = 0
+    sync_backoff_until: Optional[datetime] = None
 
 # -----------------------------------------------------------------------------
 # File Models
 # -----------------------------------------------------------------------------
 
 class OriginalFile(BaseModel):
+    source: Literal["original"] = "original"
     file_id: str
     project_id: str
     file_path: str
     file_type: str
     content: str
+    content_hash: Optional[str] = None
     sha: str
     last_modified: datetime
     synced_at: datetime
@@ -55,7 +60,8 @@ class OriginalFile(BaseModel):
     file_name: Optional[str] = ""
 
 class ModifiedFile(BaseModel):
-    file_id: Optional[str] = Field(default_factory=lambda: str(uuid4()))
+    source: Literal["modified"] = "modified"
+    file_id: Optional[str] = Field(default_factory=lambda: uuid4().hex)
     project_id: str
     modified: bool = True
     file_type: str
@@ -66,24 +72,41 @@ class ModifiedFile(BaseModel):
     benchmark_type: Optional[str] = ""
     file_name: Optional[str] = ""
 
+# Original or modified file, dispatched on the "source" tag
+AnyFile = Annotated[Union[OriginalFile, ModifiedFile], Field(discriminator="source")]
+
 # -----------------------------------------------------------------------------
 # API Request/Response Models
 # -----------------------------------------------------------------------------
 
+# 응답 전용 모델은 생성 후 변경하지 않으므로 불변으로 고정
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
 class SyncRequest(BaseModel):
     project_id: str
 
 class SyncResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     status: str
     message: str
     synced_files: int
     project_id: str
+    # 변경 건수 (모두 0이면 저장소에 변경 없음)
+    new_files: int = 0
+    updated_files: int = 0
+    unchanged_files: int = 0
+    deleted_files: int = 0
 
 class FileListResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     original_files: List[OriginalFile]
     modified_files: List[ModifiedFile]
 
 class ProjectStats(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     total_original_files: int
     total_modified_files: int
     config_files: int
@@ -91,6 +114,8 @@ class ProjectStats(BaseModel):
     last_sync: Optional[datetime]
 
 class ProjectWithStats(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     project: Project
     stats: ProjectStats
 
@@ -99,11 +124,15 @@ class ProjectWithStats(BaseModel):
 # -----------------------------------------------------------------------------
 
 class HealthResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     status: str
     service: str
     timestamp: datetime
 
 class SystemStatus(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     service: str
     status: str
     total_projects: int
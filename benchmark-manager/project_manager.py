@@ -1,12 +1,38 @@
 import asyncio
 import logging
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+from pydantic import TypeAdapter, ValidationError
+from pymongo import UpdateOne, DeleteMany, ReturnDocument
+from pymongo.results import BulkWriteResult
+
+from config import (
+    SYNC_WRITE_BATCH_SIZE, SYNC_MAX_CONCURRENT_WRITES, CURSOR_BATCH_SIZE,
+    SYNC_BACKOFF_BASE, SYNC_BACKOFF_MAX_FACTOR
+)
 from database import get_projects_collection, get_original_files_collection, get_modified_files_collection
+from blob_store import content_hash, store_blobs, attach_contents, delete_unreferenced_blobs
 from github_client import create_github_client
-from models import Project, ProjectCreate, ProjectUpdate, ProjectWithStats, ProjectStats, SyncResponse, OriginalFile
+from models import Project, ProjectCreate, ProjectUpdate, ProjectWithStats, ProjectStats, SyncResponse, OriginalFile, AnyFile
+
+# Project fields that change which files a sync fetches
+SYNC_SOURCE_FIELDS = {"project_type", "repository_url", "github_token", "config_path", "job_path", "vllm_values_path"}
+
+# File fetcher per project type
+FETCHERS = {
+    # VLLM 프로젝트: custom-values*.yaml 파일들
+    "vllm": lambda gh, project: gh.fetch_vllm_files(project.vllm_values_path),
+    # Benchmark 프로젝트: 벤치마크 폴더의 종류별 파일들
+    "benchmark": lambda gh, project: gh.fetch_all_files(project.config_path)
+}
+
+# Built once per process and reused for every validation
+PROJECT_ADAPTER = TypeAdapter(Project)
+PROJECTS_ADAPTER = TypeAdapter(List[Project])
+FILES_ADAPTER = TypeAdapter(List[AnyFile])
+FILE_ADAPTER = TypeAdapter(AnyFile)
 
 # -----------------------------------------------------------------------------
 # Project Management
@@ -16,10 +42,10 @@ async def create_project(project_data: ProjectCreate) -> Project:
     """Create a new project."""
     collection = get_projects_collection()
     
-    project_id = str(uuid4())
-    now = datetime.now()
+    project_id = uuid4().hex
+    now = datetime.now(timezone.utc)
     
-    logging.info(f"Creating project with data: {project_data.dict()}")
+    logging.info(f"Creating project with data: {project_data.model_dump()}")
     
     project_doc = {
         "project_id": project_id,
@@ -37,62 +63,66 @@ async def create_project(project_data: ProjectCreate) -> Project:
     
     await collection.insert_one(project_doc)
     
-    project = Project(**project_doc)
+    project = PROJECT_ADAPTER.validate_python(project_doc)
     logging.info(f"Created project {project_id} - manual sync only")
     
     return project
 
+async def migrate_projects():
+    """Backfill fields added after the first release on existing projects (run once at startup)."""
+    collection = get_projects_collection()
+    
+    # 기존 프로젝트에 새로운 필드가 없는 경우 기본값 설정
+    defaults = {"project_type": "benchmark", "vllm_values_path": ""}
+    for field, value in defaults.items():
+        result = await collection.update_many({field: {"$exists": False}}, {"$set": {field: value}})
+        if result.modified_count:
+            logging.info(f"Backfilled {field} on {result.modified_count} projects")
+
 async def get_project(project_id: str) -> Optional[Project]:
     """Get a project by ID."""
     collection = get_projects_collection()
     project_doc = await collection.find_one({"project_id": project_id}, {"_id": 0})
     
     if project_doc:
-        # 기존 프로젝트에 새로운 필드가 없는 경우 기본값 설정
-        if "project_type" not in project_doc:
-            project_doc["project_type"] = "benchmark"
-        if "vllm_values_path" not in project_doc:
-            project_doc["vllm_values_path"] = ""
-        return Project(**project_doc)
+        return PROJECT_ADAPTER.validate_python(project_doc)
     return None
 
 async def list_projects() -> List[Project]:
     """List all projects."""
     collection = get_projects_collection()
-    cursor = collection.find({}, {"_id": 0})
-    projects = []
-    
-    async for doc in cursor:
-        # 기존 프로젝트에 새로운 필드가 없는 경우 기본값 설정
-        if "project_type" not in doc:
-            doc["project_type"] = "benchmark"
-        if "vllm_values_path" not in doc:
-            doc["vllm_values_path"] = ""
-        projects.append(Project(**doc))
-    
-    return projects
+    cursor = collection.find({}, {"_id": 0}).batch_size(CURSOR_BATCH_SIZE)
+    docs = await cursor.to_list(None)
+    
+    return PROJECTS_ADAPTER.validate_python(docs)
 
 async def update_project(project_id: str, update_data: ProjectUpdate) -> Optional[Project]:
     """Update a project."""
     collection = get_projects_collection()
     
-    update_dict = {}
-    for field, value in update_data.dict(exclude_unset=True).items():
-        if value is not None:
-            update_dict[field] = value
+    update_dict = update_data.model_dump(exclude_unset=True, exclude_none=True)
     
     if not update_dict:
         return await get_project(project_id)
     
-    update_dict["updated_at"] = datetime.now()
+    update_dict["updated_at"] = datetime.now(timezone.utc)
     
-    result = await collection.update_one(
+    # 저장소나 경로가 바뀌면 다음 sync에서 전체 파일을 다시 가져오도록 ETag 초기화
+    # (토큰/경로 수정으로 원인이 해결되었을 수 있으므로 실패 backoff도 초기화)
+    if update_dict.keys() & SYNC_SOURCE_FIELDS:
+        update_dict["repo_etag"] = None
+        update_dict["consecutive_failures"] = 0
+        update_dict["sync_backoff_until"] = None
+    
+    project_doc = await collection.find_one_and_update(
         {"project_id": project_id},
-        {"$set": update_dict}
+        {"$set": update_dict},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
     
-    if result.modified_count > 0:
-        return await get_project(project_id)
+    if project_doc:
+        return PROJECT_ADAPTER.validate_python(project_doc)
     return None
 
 async def delete_project(project_id: str) -> bool:
@@ -100,7 +130,11 @@ async def delete_project(project_id: str) -> bool:
     projects_collection = get_projects_collection()
     files_collection = get_original_files_collection()
     
+    # 삭제 후 더 이상 참조되지 않는 blob을 정리하기 위해 해시를 먼저 조회
+    file_hashes = await files_collection.distinct("content_hash", {"project_id": project_id})
+    
     await files_collection.delete_many({"project_id": project_id})
+    await delete_unreferenced_blobs(file_hashes)
     
     result = await projects_collection.delete_one({"project_id": project_id})
     
@@ -112,48 +146,92 @@ async def get_project_with_stats(project_id: str) -> Optional[ProjectWithStats]:
     if not project:
         return None
     
-    stats = await get_project_stats(project_id)
+    stats = await get_project_stats(project_id, project)
     
-    return ProjectWithStats(project=project, stats=stats)
+    # 이미 검증된 모델이므로 재검증 없이 조립
+    return ProjectWithStats.model_construct(project=project, stats=stats)
 
-async def get_project_stats(project_id: str) -> ProjectStats:
-    """Get project statistics."""
+async def get_project_stats(project_id: str, project: Optional[Project] = None) -> ProjectStats:
+    """Get project statistics; pass an already fetched project to skip looking it up again."""
     files_collection = get_original_files_collection()
     modified_files_collection = get_modified_files_collection()
     
-    total_files = await files_collection.count_documents({"project_id": project_id})
-    
-    config_files = await files_collection.count_documents({
-        "project_id": project_id, 
-        "file_type": "config"
-    })
-    job_files = await files_collection.count_documents({
-        "project_id": project_id, 
-        "file_type": "job"
-    })
-    
-    project = await get_project(project_id)
+    # file_type별 원본 파일 수, 수정 파일 수 (프로젝트를 받지 않았으면 프로젝트 조회도) 동시에 실행
+    lookups = [
+        files_collection.aggregate([
+            {"$match": {"project_id": project_id}},
+            {"$group": {"_id": "$file_type", "n": {"$sum": 1}}}
+        ]).to_list(None),
+        modified_files_collection.count_documents({"project_id": project_id})
+    ]
+    if project is None:
+        lookups.append(get_project(project_id))
+    
+    results = await asyncio.gather(*lookups)
+    type_counts, modified_files = results[0], results[1]
+    if project is None:
+        project = results[2]
+    
+    counts = {group["_id"]: group["n"] for group in type_counts}
     last_sync = project.last_sync if project else None
     
-    # Count modified files properly
-    modified_files = await modified_files_collection.count_documents({"project_id": project_id})
-    
-    return ProjectStats(
-        total_original_files=total_files,
+    # 집계 결과는 서버에서 계산한 정수이므로 검증을 생략
+    return ProjectStats.model_construct(
+        total_original_files=sum(counts.values()),
         total_modified_files=modified_files,
-        config_files=config_files,
-        job_files=job_files,
+        config_files=counts.get("config", 0),
+        job_files=counts.get("job", 0),
         last_sync=last_sync
     )
 
+async def total_files_count(project_ids: List[str]) -> int:
+    """Count original and modified files across the given projects."""
+    query = {"project_id": {"$in": project_ids}}
+    original_count, modified_count = await asyncio.gather(
+        get_original_files_collection().count_documents(query),
+        get_modified_files_collection().count_documents(query)
+    )
+    return original_count + modified_count
+
 # -----------------------------------------------------------------------------
 # File Synchronization
 # -----------------------------------------------------------------------------
 
 
 
+async def bulk_write_chunked(collection, write_ops: list) -> List[BulkWriteResult]:
+    """Run unordered bulk writes in chunks, several chunks in flight at once."""
+    sem = asyncio.Semaphore(SYNC_MAX_CONCURRENT_WRITES)
+    
+    async def _write(chunk):
+        async with sem:
+            return await collection.bulk_write(chunk, ordered=False)
+    
+    return await asyncio.gather(*[
+        _write(write_ops[i:i + SYNC_WRITE_BATCH_SIZE])
+        for i in range(0, len(write_ops), SYNC_WRITE_BATCH_SIZE)
+    ])
+
+async def record_sync_failure(project: Project):
+    """Count a failed sync and push the next allowed sync out with exponential backoff."""
+    failures = project.consecutive_failures + 1
+    delay = min(2 ** failures, SYNC_BACKOFF_MAX_FACTOR) * SYNC_BACKOFF_BASE
+    try:
+        await get_projects_collection().update_one(
+            {"project_id": project.project_id},
+            {"$set": {
+                "consecutive_failures": failures,
+                "sync_backoff_until": datetime.now(timezone.utc) + timedelta(seconds=delay)
+            }}
+        )
+    except Exception as e:
+        logging.error(f"Error recording sync failure for project {project.project_id}: {e}")
+
 async def sync_project_files(project_id: str) -> SyncResponse:
     """Sync files from GitHub for a specific project."""
+    # 이번 sync의 모든 synced_at / last_sync에 같은 시각을 사용
+    sync_start = datetime.now(timezone.utc)
+    
     project = await get_project(project_id)
     if not project:
         return SyncResponse(
@@ -162,93 +240,212 @@ async def sync_project_files(project_id: str) -> SyncResponse:
             synced_files=0,
             project_id=project_id
         )
+    
+    # 연속 실패 후 backoff 기간 중에는 GitHub 호출 생략
+    if project.sync_backoff_until and project.sync_backoff_until > sync_start:
+        return SyncResponse(
+            status="error",
+            message=f"Sync backing off after {project.consecutive_failures} consecutive failures "
+                    f"until {project.sync_backoff_until.isoformat()}",
+            synced_files=0,
+            project_id=project_id
+        )
+    
+    # 알 수 없는 프로젝트 타입은 설정 오류이므로 GitHub를 호출하지 않고 실패 횟수에도 포함하지 않음
+    project_type = project.project_type or "benchmark"
+    fetch_files = FETCHERS.get(project_type)
+    if fetch_files is None:
+        return SyncResponse(
+            status="error",
+            message=f"Unsupported project_type: {project_type}",
+            synced_files=0,
+            project_id=project_id
+        )
+    
+    projects_collection = get_projects_collection()
         
     try:
+        files_collection = get_original_files_collection()
         github_client = create_github_client(project.repository_url, project.github_token)
         
-        # 프로젝트 타입에 따라 다른 파일 fetch 로직 사용
-        if project.project_type == "vllm":
-            # VLLM 프로젝트의 경우 custom-values*.yaml 파일들을 찾음
-            all_files = await github_client.fetch_vllm_files(project.vllm_values_path)
-        else:
-            # Benchmark 프로젝트의 경우 벤치마크 폴더에서 종류별 파일들 가져오기
-            all_files = await github_client.fetch_all_files(project.config_path)
-        
-        files_collection = get_original_files_collection()
+        # 저장소 HEAD가 마지막 sync 이후 그대로면 (304) 파일 조회 없이 종료
+        changed, repo_etag = await github_client.fetch_head_etag(project.repo_etag)
+        if not changed:
+            await projects_collection.update_one(
+                {"project_id": project_id},
+                {"$set": {"last_sync": sync_start, "consecutive_failures": 0, "sync_backoff_until": None}}
+            )
+            logging.info(f"Repository unchanged since last sync for project {project_id}")
+            return SyncResponse(
+                status="success",
+                message="Repository unchanged since last sync",
+                synced_files=0,
+                project_id=project_id
+            )
         
         # 기존 파일들을 file_path를 키로 하는 딕셔너리로 조회
-        existing_files = {}
-        existing_cursor = files_collection.find({"project_id": project_id})
-        async for doc in existing_cursor:
-            existing_files[doc["file_path"]] = doc
+        # (비교에 필요한 필드만 가져오고 content는 전송하지 않음)
+        existing_docs = await files_collection.find(
+            {"project_id": project_id},
+            {"_id": 0, "file_path": 1, "file_id": 1, "sha": 1, "etag": 1}
+        ).batch_size(CURSOR_BATCH_SIZE).to_list(None)
+        existing_files = {doc["file_path"]: doc for doc in existing_docs}
+        
+        # 기존 파일의 ETag를 사용해 변경되지 않은 파일은 304로 처리
+        github_client.file_cache = existing_files
+        
+        # 프로젝트 타입별 fetch 함수로 파일 가져오기
+        all_files = await fetch_files(github_client, project)
         
-        synced_count = 0
-        updated_count = 0
-        new_count = 0
+        # 일부 목록/파일 조회가 실패했으면 결과에 없는 파일이 삭제된 것인지 알 수 없음
+        incomplete = github_client.incomplete
         
-        # GitHub에서 가져온 파일 경로들을 추적
-        github_file_paths = set()
+        # GitHub에서 가져온 파일 경로들
+        github_file_paths = frozenset(file_data["file_path"] for file_data in all_files)
+        
+        # 파일별 쓰기를 모아서 한 번의 bulk_write로 처리
+        write_ops = []
+        blobs = {}
+        unchanged_count = 0
+        etag_refresh_count = 0
+        # 내용이 바뀌거나 삭제되어 기존 blob 참조가 사라지는 파일 경로
+        replaced_paths = []
         
         for file_data in all_files:
             file_path = file_data["file_path"]
-            github_file_paths.add(file_path)
+            
+            # sha가 같으면 내용이 그대로이므로 문서를 다시 쓰지 않음
+            # (ETag만 바뀐 경우 다음 조건부 요청을 위해 etag 필드만 갱신)
+            existing_file = existing_files.get(file_path)
+            if existing_file and existing_file.get("sha") == file_data["sha"]:
+                unchanged_count += 1
+                if file_data.get("etag") and existing_file.get("etag") != file_data["etag"]:
+                    etag_refresh_count += 1
+                    write_ops.append(UpdateOne(
+                        {"project_id": project_id, "file_path": file_path},
+                        {"$set": {"etag": file_data["etag"]}}
+                    ))
+                continue
             
             # 기존 파일이 있으면 기존 file_id 사용, 없으면 새 file_id 생성
-            if file_path in existing_files:
-                file_id = existing_files[file_path]["file_id"]
-                updated_count += 1
-            else:
-                file_id = str(uuid4())
-                new_count += 1
+            file_id = existing_file["file_id"] if existing_file else uuid4().hex
+            if existing_file:
+                replaced_paths.append(file_path)
+            
+            # content는 해시로 중복 제거한 blob에 저장하고 문서에는 해시만 기록
+            file_hash = content_hash(file_data["content"])
+            blobs[file_hash] = file_data["content"]
             
             file_doc = {
                 "file_id": file_id,
                 "project_id": project_id,
                 "file_path": file_path,
                 "file_type": file_data["file_type"],
-                "content": file_data["content"],
+                "content_hash": file_hash,
                 "sha": file_data["sha"],
+                "etag": file_data.get("etag"),
                 "last_modified": file_data["last_modified"],
-                "synced_at": datetime.now()
+                "synced_at": sync_start
             }
             
-            await files_collection.update_one(
+            write_ops.append(UpdateOne(
                 {
                     "project_id": project_id,
                     "file_path": file_path
                 },
-                {"$set": file_doc},
+                {"$set": file_doc, "$unset": {"content": ""}},
                 upsert=True
+            ))
+        
+        # GitHub에 없는 기존 파일들은 한 번의 DeleteMany로 삭제 (전체 조회에 성공한 경우만)
+        stale_paths = list(existing_files.keys() - github_file_paths)
+        if stale_paths and not incomplete:
+            write_ops.append(DeleteMany({
+                "project_id": project_id,
+                "file_path": {"$in": stale_paths}
+            }))
+            replaced_paths.extend(stale_paths)
+        
+        synced_count = len(all_files)
+        
+        # 덮어쓰거나 삭제할 문서가 참조하던 blob 해시 (쓰기 후 참조가 없으면 정리)
+        old_hashes = []
+        if replaced_paths:
+            old_hashes = await files_collection.distinct(
+                "content_hash", {"project_id": project_id, "file_path": {"$in": replaced_paths}}
             )
-            synced_count += 1
         
-        # GitHub에 없는 기존 파일들 삭제
-        deleted_count = 0
-        for existing_path in existing_files.keys():
-            if existing_path not in github_file_paths:
-                await files_collection.delete_one({
-                    "project_id": project_id,
-                    "file_path": existing_path
-                })
-                deleted_count += 1
+        # 파일 문서가 참조하기 전에 blob부터 저장
+        await store_blobs(blobs)
+        write_results = await bulk_write_chunked(files_collection, write_ops)
+        await delete_unreferenced_blobs(set(old_hashes) - blobs.keys())
+        
+        # 신규/수정/삭제 건수는 Mongo가 실제로 반영한 결과에서 집계
+        new_count = sum(result.upserted_count for result in write_results)
+        updated_count = sum(result.modified_count for result in write_results) - etag_refresh_count
+        deleted_count = sum(result.deleted_count for result in write_results)
+        
+        if incomplete and not github_client.failed:
+            # 목록 조회 후 push로 파일이 사라진 경우: 오류가 아니므로 backoff 없이
+            # repo_etag만 저장하지 않아 다음 sync에서 새 tree를 다시 조회
+            await projects_collection.update_one(
+                {"project_id": project_id},
+                {"$set": {"last_sync": sync_start, "consecutive_failures": 0, "sync_backoff_until": None}}
+            )
+            logging.info(f"Repository changed during sync for project {project_id}, deletions deferred to next sync")
+            return SyncResponse(
+                status="success",
+                message=f"Synced {synced_count} files ({new_count} new, {updated_count} updated, {unchanged_count} unchanged); "
+                        f"repository changed during sync, deletions deferred to next sync",
+                synced_files=synced_count,
+                project_id=project_id,
+                new_files=new_count,
+                updated_files=updated_count,
+                unchanged_files=unchanged_count
+            )
+        
+        if incomplete:
+            # 가져온 파일만 반영하고 repo_etag는 저장하지 않아 다음 sync에서 다시 전체 조회
+            logging.warning(f"Partial sync for project {project_id}: {synced_count} files fetched, "
+                            f"skipped deleting {len(stale_paths)} files not returned by GitHub")
+            await record_sync_failure(project)
+            return SyncResponse(
+                status="error",
+                message=f"Partial sync: some GitHub requests failed ({new_count} new, {updated_count} updated, "
+                        f"{unchanged_count} unchanged, deletions skipped)",
+                synced_files=synced_count,
+                project_id=project_id,
+                new_files=new_count,
+                updated_files=updated_count,
+                unchanged_files=unchanged_count
+            )
         
-        projects_collection = get_projects_collection()
         await projects_collection.update_one(
             {"project_id": project_id},
-            {"$set": {"last_sync": datetime.now()}}
+            {"$set": {
+                "last_sync": sync_start,
+                "repo_etag": repo_etag,
+                "consecutive_failures": 0,
+                "sync_backoff_until": None
+            }}
         )
         
-        logging.info(f"Synced {synced_count} files for project {project_id}: {new_count} new, {updated_count} updated, {deleted_count} deleted")
+        logging.info(f"Synced {synced_count} files for project {project_id}: {new_count} new, {updated_count} updated, {unchanged_count} unchanged, {deleted_count} deleted")
         
         return SyncResponse(
             status="success",
-            message=f"Successfully synced {synced_count} files ({new_count} new, {updated_count} updated, {deleted_count} deleted)",
+            message=f"Successfully synced {synced_count} files ({new_count} new, {updated_count} updated, {unchanged_count} unchanged, {deleted_count} deleted)",
             synced_files=synced_count,
-            project_id=project_id
+            project_id=project_id,
+            new_files=new_count,
+            updated_files=updated_count,
+            unchanged_files=unchanged_count,
+            deleted_files=deleted_count
         )
         
     except Exception as e:
         logging.error(f"Error syncing files for project {project_id}: {e}")
+        await record_sync_failure(project)
         return SyncResponse(
             status="error",
             message=f"Sync failed: {str(e)}",
@@ -256,52 +453,55 @@ async def sync_project_files(project_id: str) -> SyncResponse:
             project_id=project_id
         )
 
-async def get_project_files(project_id: str, file_type: Optional[str] = None):
+async def sync_project_files_bounded(project_id: str, sem: asyncio.Semaphore) -> SyncResponse:
+    """Sync a project while holding a slot of the given semaphore."""
+    async with sem:
+        return await sync_project_files(project_id)
+
+async def get_project_files(project_id: str, file_type: Optional[str] = None) -> List[AnyFile]:
     """Get all files (original and modified) for a project with optional file_type filter."""
     original_files_collection = get_original_files_collection()
     modified_files_collection = get_modified_files_collection()
     
-    all_files = []
-    
-    # Query for original files
-    original_query = {"project_id": project_id}
-    if file_type:
-        original_query["file_type"] = file_type
-    
-    original_cursor = original_files_collection.find(original_query, {"_id": 0})
-    
-    async for doc in original_cursor:
-        file_data = dict(doc)
-        file_data["source"] = "original"  # Mark as original file
-        
-        # file_path에서 benchmark_type과 file_name 추출
-        file_path = file_data.get("file_path", "")
-        path_parts = file_path.split("/")
-        file_data["benchmark_type"] = path_parts[-2] if len(path_parts) > 1 else ""
-        file_data["file_name"] = path_parts[-1] if path_parts else file_path
-        
-        all_files.append(file_data)
-    
-    # Query for modified files
-    modified_query = {"project_id": project_id}
+    query = {"project_id": project_id}
     if file_type:
-        modified_query["file_type"] = file_type
-    
-    modified_cursor = modified_files_collection.find(modified_query, {"_id": 0})
-    
-    async for doc in modified_cursor:
-        file_data = dict(doc)
-        file_data["source"] = "modified"  # Mark as modified file
-        
-        # file_path에서 benchmark_type과 file_name 추출
-        file_path = file_data.get("file_path", "")
-        path_parts = file_path.split("/")
-        file_data["benchmark_type"] = path_parts[-2] if len(path_parts) > 1 else ""
-        file_data["file_name"] = path_parts[-1] if path_parts else file_path
-        
-        all_files.append(file_data)
+        query["file_type"] = file_type
+    
+    # original / modified 표시와 file_path에서 benchmark_type, file_name 추출은 Mongo에서 처리
+    async def _drain(collection, source):
+        cursor = collection.aggregate([
+            {"$match": query},
+            {"$project": {"_id": 0}},
+            {"$addFields": {
+                "source": source,
+                "file_name": {"$arrayElemAt": [{"$split": ["$file_path", "/"]}, -1]},
+                "benchmark_type": {"$ifNull": [{"$arrayElemAt": [{"$split": ["$file_path", "/"]}, -2]}, ""]}
+            }}
+        ], batchSize=CURSOR_BATCH_SIZE)
+        return await attach_contents(await cursor.to_list(None))
+    
+    # 두 컬렉션은 서로 독립적이므로 동시에 조회
+    original_files, modified_files = await asyncio.gather(
+        _drain(original_files_collection, "original"),
+        _drain(modified_files_collection, "modified")
+    )
     
-    return all_files
+    # source 태그로 OriginalFile / ModifiedFile을 바로 선택해서 한 번에 검증
+    docs = original_files + modified_files
+    try:
+        return FILES_ADAPTER.validate_python(docs)
+    except ValidationError:
+        pass
+    
+    # 필드가 빠진 예전 문서나 blob이 없는 문서가 있으면 문서별로 검증해서 해당 파일만 제외
+    files = []
+    for doc in docs:
+        try:
+            files.append(FILE_ADAPTER.validate_python(doc))
+        except ValidationError as e:
+            logging.warning(f"Skipping invalid {doc.get('source')} file {doc.get('file_path')} "
+                            f"in project {project_id}: {e.error_count()} validation errors")
+    return files
 
 # -----------------------------------------------------------------------------
 # Background Polling (DISABLED - Manual sync only)
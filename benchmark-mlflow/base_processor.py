@@ -1,11 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 
+def deployment_timestamp(now: Optional[datetime] = None) -> str:
+    """global.timestamp 형식(YYYYmmdd-HHMMSS)의 문자열 생성 (strftime 대신 정수 포맷)"""
+    n = now or datetime.now()
+    return f"{n.year:04d}{n.month:02d}{n.day:02d}-{n.hour:02d}{n.minute:02d}{n.second:02d}"
+
+
 class BaseYAMLProcessor(ABC):
     """YAML 처리를 위한 기본 추상 클래스"""
     
+    # k8s 이름에 쓸 수 없는 문자를 '-'로 바꾸는 변환 테이블
+    _K8S_NAME_TRANS = str.maketrans({"/": "-", ".": "-", "_": "-"})
+    
     def __init__(self, benchmark_eval_url: str):
         """
         Args:
@@ -16,7 +25,7 @@ class BaseYAMLProcessor(ABC):
     @abstractmethod
     def process_yaml_data(self, yaml_data: Dict[str, Any], model_name: str, 
                          run_id: str, experiment_id: str, model_id: str, 
-                         version: str) -> Dict[str, Any]:
+                         version: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         엔진별 YAML 데이터 처리
         
@@ -27,6 +36,7 @@ class BaseYAMLProcessor(ABC):
             experiment_id: MLflow 실험 ID
             model_id: 모델 ID
             version: 모델 버전
+            timestamp: global.timestamp 값 (없으면 현재 시각)
             
         Returns:
             처리된 YAML 데이터
@@ -48,11 +58,11 @@ class BaseYAMLProcessor(ABC):
     
     def _get_model_name_k8s(self, model_name: str) -> str:
         """모델명을 k8s 호환 형태로 변환"""
-        return model_name.replace("/", "-").replace(".", "-").replace("_", "-").lower()
+        return model_name.translate(self._K8S_NAME_TRANS).lower()
     
     def _update_global_section(self, yaml_data: Dict[str, Any], model_name: str,
                               run_id: str, experiment_id: str, model_id: str,
-                              version: str) -> None:
+                              version: str, timestamp: Optional[str] = None) -> None:
         """Global 섹션 업데이트 (공통 로직)"""
         if 'global' not in yaml_data:
             yaml_data['global'] = {}
@@ -60,6 +70,6 @@ class BaseYAMLProcessor(ABC):
         yaml_data['global']['experimentId'] = experiment_id
         yaml_data['global']['runid'] = run_id
         yaml_data['global']['modelid'] = model_id
-        yaml_data['global']['timestamp'] = datetime.now().strftime("%Y%m%d-%H%M%S")
+        yaml_data['global']['timestamp'] = timestamp or deployment_timestamp()
         yaml_data['global']['modelName'] = model_name
         yaml_data['global']['modelVersion'] = version 
\ No newline at end of file
@@ -1,4 +1,7 @@
 import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Tuple
 try:
     from dotenv import load_dotenv
     # Load environment variables from .env file
@@ -13,34 +16,64 @@ except ImportError:
 
 # Inference Engine Configuration
 INFERENCE_ENGINE_TYPE = os.getenv('INFERENCE_ENGINE_TYPE')  # vllm, tensorrt-llm, all
+SUPPORTED_ENGINES = ('vllm', 'tensorrt-llm')
+
+@dataclass(frozen=True)
+class EngineSettings:
+    """import 시 환경변수에서 한 번만 계산해 두는 엔진/템플릿 설정"""
+    engine_type: str                 # 소문자로 정규화된 INFERENCE_ENGINE_TYPE (미설정 시 vllm)
+    template_base: str               # YAML_TEMPLATE_PATH
+    engines: Tuple[str, ...]         # 처리할 엔진 목록
+    template_paths: Mapping[str, str]  # 엔진별 템플릿 경로
+
+def _load_engine_settings() -> EngineSettings:
+    engine_type = INFERENCE_ENGINE_TYPE.lower() if INFERENCE_ENGINE_TYPE else 'vllm'
+    template_base = os.getenv('YAML_TEMPLATE_PATH', 'template')
+    
+    if engine_type == "all":
+        engines = SUPPORTED_ENGINES
+    elif engine_type in SUPPORTED_ENGINES:
+        engines = (engine_type,)
+    else:
+        # 기본값
+        engines = ('vllm',)
+    
+    return EngineSettings(
+        engine_type=engine_type,
+        template_base=template_base,
+        engines=engines,
+        template_paths=MappingProxyType({
+            engine: f"{template_base}/{engine}.yaml" for engine in SUPPORTED_ENGINES
+        })
+    )
+
+ENGINE_SETTINGS = _load_engine_settings()
 
 # 동적 경로 생성
 def get_yaml_model_file_path(engine_type: str = None) -> str:
     """INFERENCE_ENGINE_TYPE에 따른 YAML 모델 파일 경로 반환"""
-    if engine_type is None:
-        engine_type = INFERENCE_ENGINE_TYPE
+    engine_type = engine_type.lower() if engine_type else ENGINE_SETTINGS.engine_type
     
-    if engine_type.lower() == "all":
+    if engine_type == "all":
         return ""  # all 타입인 경우 각 엔진별로 별도 처리
     else:
-        return engine_type.lower()
+        return engine_type
 
 def get_yaml_template_path(engine_type: str = None) -> str:
     """INFERENCE_ENGINE_TYPE에 따른 YAML 템플릿 경로 반환"""
-    if engine_type is None:
-        engine_type = INFERENCE_ENGINE_TYPE
+    engine_type = engine_type.lower() if engine_type else ENGINE_SETTINGS.engine_type
     
-    # 환경변수에서 직접 template 베이스 경로 가져오기
-    template_base = os.getenv('YAML_TEMPLATE_PATH', 'template')
+    if engine_type == "all":
+        return ENGINE_SETTINGS.template_base  # all 타입인 경우 기본 경로만 반환
     
-    if engine_type.lower() == "all":
-        return template_base  # all 타입인 경우 기본 경로만 반환
-    else:
-        return f"{template_base}/{engine_type.lower()}.yaml"
+    template_path = ENGINE_SETTINGS.template_paths.get(engine_type)
+    if template_path is None:
+        template_path = f"{ENGINE_SETTINGS.template_base}/{engine_type}.yaml"
+    return template_path
 
 # 동적으로 생성되는 경로들 (기본값만 설정, 실제로는 함수 사용)
 YAML_MODEL_FILE_PATH = get_yaml_model_file_path()  # 하위 호환성용
-YAML_TEMPLATE_PATH = os.getenv('YAML_TEMPLATE_PATH', 'template')  # 기본 템플릿 베이스 경로
+YAML_TEMPLATE_PATH = ENGINE_SETTINGS.template_base  # 기본 템플릿 베이스 경로
 
 ARGO_FILE_PATH = os.getenv('ARGO_FILE_PATH', 'argo-application.yaml')
 ARGO_PROJECT_TEMPLATE_PATH = os.getenv('ARGO_PROJECT_TEMPLATE_PATH', 'argo-project-template.yaml')
@@ -60,6 +93,17 @@ GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', "")
 GITHUB_REPO_OWNER = os.getenv('GITHUB_REPO_OWNER', "")
 GITHUB_REPO_NAME = os.getenv('GITHUB_REPO_NAME', "")
 
+# GitHub HTTP Configuration (requests.Session 연결 풀 / 재시도)
+GITHUB_POOL_CONNECTIONS = int(os.getenv('GITHUB_POOL_CONNECTIONS', '4'))
+GITHUB_POOL_MAXSIZE = int(os.getenv('GITHUB_POOL_MAXSIZE', '16'))
+GITHUB_MAX_RETRIES = int(os.getenv('GITHUB_MAX_RETRIES', '3'))
+GITHUB_RETRY_BACKOFF = float(os.getenv('GITHUB_RETRY_BACKOFF', '0.3'))
+GITHUB_RETRY_STATUSES = (429, 500, 502, 503, 504)
+GITHUB_MAX_WORKERS = int(os.getenv('GITHUB_MAX_WORKERS', '4'))  # 독립적인 GitHub 조회 동시 실행 수
+GITHUB_TEMPLATE_CACHE_TTL = float(os.getenv('GITHUB_TEMPLATE_CACHE_TTL', '300'))  # 템플릿 캐시 유지 시간(초)
+GITHUB_RATE_LIMIT_MAX_WAIT = float(os.getenv('GITHUB_RATE_LIMIT_MAX_WAIT', '60'))  # rate limit 대기 최대 시간(초)
+GITHUB_COMMIT_MAX_ATTEMPTS = int(os.getenv('GITHUB_COMMIT_MAX_ATTEMPTS', '3'))  # 브랜치 이동(422) 시 일괄 커밋 최대 시도 횟수
+
 # Template Repository Configuration (템플릿용 별도 레포)
 TEMPLATE_REPO_OWNER = os.getenv('TEMPLATE_REPO_OWNER', GITHUB_REPO_OWNER)  # 기본값은 메인 레포와 동일
 TEMPLATE_REPO_NAME = os.getenv('TEMPLATE_REPO_NAME', GITHUB_REPO_NAME)    # 기본값은 메인 레포와 동일
@@ -91,15 +135,7 @@ DEFAULT_POLL_HOURS = 24
 
 def get_engines_to_process() -> list:
     """INFERENCE_ENGINE_TYPE에 따른 처리할 엔진 목록 반환"""
-    engine_type = INFERENCE_ENGINE_TYPE.lower() if INFERENCE_ENGINE_TYPE else 'vllm'
-    
-    if engine_type == "all":
-        return ['vllm', 'tensorrt-llm']
-    elif engine_type in ['vllm', 'tensorrt-llm']:
-        return [engine_type]
-    else:
-        # 기본값
-        return ['vllm']
+    return list(ENGINE_SETTINGS.engines)
 
 def get_github_config():
     """Get GitHub configuration if available."""
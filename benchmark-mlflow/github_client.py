@@ -1,19 +1,171 @@
-import base64
+try:
+    # SIMD 가속 base64 (API는 표준 base64와 동일)
+    import pybase64 as base64
+except ImportError:
+    import base64
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
+import binascii
+import hashlib
 import logging
-from typing import Dict, Optional
+import string
+import threading
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from models import GitHubConfig, GitHubFileUpdate
 from config import (ARGO_FILE_PATH, YAML_TEMPLATE_PATH, TEMPLATE_REPO_OWNER, TEMPLATE_REPO_NAME, 
                    ARGO_REPO_OWNER, ARGO_REPO_NAME, ARGOCD_PROJECT_NAME, ARGOCD_REPO_URL, ARGOCD_NAMESPACE,
                    ARGO_PROJECT_TEMPLATE_PATH, ARGO_APPLICATION_PATH, ARGO_PROJECT_PATH, YAML_MODEL_FILE_PATH, 
-                   BENCHMARK_EVAL_URL, get_yaml_model_file_path, get_yaml_template_path)
+                   BENCHMARK_EVAL_URL, get_yaml_model_file_path, get_yaml_template_path,
+                   GITHUB_POOL_CONNECTIONS, GITHUB_POOL_MAXSIZE, GITHUB_MAX_RETRIES, GITHUB_RETRY_BACKOFF,
+                   GITHUB_RETRY_STATUSES, GITHUB_MAX_WORKERS, GITHUB_TEMPLATE_CACHE_TTL,
+                   GITHUB_RATE_LIMIT_MAX_WAIT, GITHUB_COMMIT_MAX_ATTEMPTS)
 from vllm_processor import VLLMProcessor
 from tensorrt_llm_processor import TensorRTLLMProcessor
 
 logger = logging.getLogger(__name__)
 
+def git_blob_sha(content: str) -> str:
+    """GitHub contents API가 돌려주는 sha와 같은 git blob sha1 계산"""
+    data = content.encode('utf-8')
+    hasher = hashlib.sha1(b"blob %d\0" % len(data))
+    hasher.update(data)
+    return hasher.hexdigest()
+
+_FORMATTER = string.Formatter()
+
+def parse_format_template(template: str) -> List[Tuple[str, Optional[str], str, Optional[str]]]:
+    """str.format 템플릿을 (literal, field, spec, conversion) 목록으로 한 번만 파싱"""
+    return list(_FORMATTER.parse(template))
+
+def render_format_template(parsed: List[Tuple[str, Optional[str], str, Optional[str]]], **kwargs) -> str:
+    """파싱된 템플릿에 값을 채워 넣기 (template.format(**kwargs)와 같은 결과)"""
+    parts = []
+    for literal, field, spec, conversion in parsed:
+        parts.append(literal)
+        if field is not None:
+            value = _FORMATTER.get_field(field, (), kwargs)[0]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, spec) if spec else str(value))
+    return ''.join(parts)
+
+def decode_github_content(content: str) -> str:
+    """contents API의 base64 본문(60자마다 줄바꿈) 디코딩
+
+    줄바꿈을 한 번에 제거한 뒤 검증 모드로 디코딩 (비검증 모드는 문자마다 알파벳 여부를 다시 확인함)
+    """
+    return base64.b64decode(content.replace('\n', ''), validate=True).decode('utf-8')
+
+# 대부분의 조회가 main 브랜치이므로 쿼리 파라미터를 한 번만 생성 (requests는 params를 수정하지 않음)
+MAIN_REF_PARAMS = {'ref': 'main'}
+
+# 404가 아닌 오류로 파일을 조회하지 못했음을 나타내는 값 (None은 파일이 없음)
+LOOKUP_FAILED = object()
+
+# contents PUT의 sha가 현재 파일과 맞지 않을 때 GitHub가 돌려주는 상태 코드
+STALE_SHA_STATUSES = (409, 422)
+
+# 커밋 전 파일별 현재 blob sha 확인용 tree 조회 파라미터
+RECURSIVE_TREE_PARAMS = {'recursive': '1'}
+
+# orjson으로 직렬화한 PUT 본문용 헤더
+JSON_CONTENT_HEADERS = {'Content-Type': 'application/json'}
+
+# libyaml C 바인딩이 있으면 사용 (없으면 순수 Python 구현)
+try:
+    from yaml import CSafeLoader as YAMLLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader, SafeDumper as _SafeDumper
+
+class YAMLDumper(_SafeDumper):
+    """템플릿 YAML은 참조를 공유하지 않으므로 anchor/alias 검사 생략"""
+    def ignore_aliases(self, data):
+        return True
+
+# yaml.dump 옵션을 한 번만 구성 (긴 줄 folding 계산을 하지 않도록 width를 충분히 크게)
+YAML_DUMP_KWARGS = dict(Dumper=YAMLDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=2**20)
+
+class GitHubRateLimitExceeded(requests.exceptions.RequestException):
+    """rate limit 재개 시각이 최대 대기 시간보다 멀어서 요청을 보내지 않음"""
+
+
+class GitHubRateLimiter:
+    """GitHub 응답의 rate limit 헤더를 보고 다음 요청 전에 대기"""
+    
+    def __init__(self, max_wait: float = GITHUB_RATE_LIMIT_MAX_WAIT):
+        """
+        Args:
+            max_wait: 대기할 최대 시간(초) - 재개 시각이 이보다 멀면 대기하지 않고 요청을 보내지 않음
+        """
+        self.max_wait = max_wait
+        self._resume_at = 0.0  # 이 시각(epoch 초) 전에는 요청하지 않음
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """
+        한도가 소진된 상태면 재개 시각까지 한 번만 대기
+        
+        lock을 잡은 채로 대기하므로 다른 요청들은 같은 재개 시각을 함께 기다림
+        
+        Raises:
+            GitHubRateLimitExceeded: 재개 시각이 max_wait보다 멀 때 (어차피 거절될 요청을 보내지 않음)
+        """
+        with self._lock:
+            delay = self._resume_at - time.time()
+            if delay <= 0:
+                return
+            if delay > self.max_wait:
+                raise GitHubRateLimitExceeded(f"GitHub rate limit 소진, {delay:.0f}초 후 재개 가능")
+            logger.warning(f"GitHub rate limit으로 {delay:.1f}초 대기")
+            time.sleep(delay)
+            self._resume_at = 0.0
+    
+    def update(self, response: requests.Response) -> None:
+        """응답 헤더(Retry-After, X-RateLimit-Remaining/Reset)로 재개 시각 갱신"""
+        headers = response.headers
+        resume_at = 0.0
+        try:
+            if response.status_code in (403, 429) and 'Retry-After' in headers:
+                # secondary rate limit
+                resume_at = time.time() + float(headers['Retry-After'])
+            elif headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+                # primary rate limit 소진 (reset은 epoch 초)
+                resume_at = float(headers['X-RateLimit-Reset'])
+        except ValueError:
+            return
+        if resume_at:
+            with self._lock:
+                self._resume_at = max(self._resume_at, resume_at)
+
+
+class RateLimitedSession(requests.Session):
+    """요청 전 GitHubRateLimiter로 대기하고 secondary rate limit(403 + Retry-After)은 한 번 재시도하는 세션"""
+    
+    def __init__(self, rate_limiter: GitHubRateLimiter):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+    
+    def request(self, method, url, *args, **kwargs):
+        self.rate_limiter.wait()
+        response = super().request(method, url, *args, **kwargs)
+        self.rate_limiter.update(response)
+        
+        # 429는 urllib3 Retry가 Retry-After를 지켜 재시도하지만 GitHub secondary limit은 403으로 옴
+        # 거절된 요청은 처리되지 않았으므로 대기 후 다시 보내도 안전
+        if response.status_code == 403 and 'Retry-After' in response.headers:
+            response.close()
+            self.rate_limiter.wait()
+            response = super().request(method, url, *args, **kwargs)
+            self.rate_limiter.update(response)
+        return response
+
+
 class GitHubClient:
     """GitHub API 클라이언트"""
     
@@ -24,158 +176,244 @@ class GitHubClient:
         """
         self.config = config
         self.base_url = "https://api.github.com"
+        
+        # 호출마다 다시 만들지 않도록 레포별 API URL을 미리 계산
+        self._repo_url = f"{self.base_url}/repos/{config.repo_owner}/{config.repo_name}"
+        self._contents_url = f"{self._repo_url}/contents"
+        self._template_contents_url = f"{self.base_url}/repos/{TEMPLATE_REPO_OWNER}/{TEMPLATE_REPO_NAME}/contents"
+        self._argo_repo_url = f"{self.base_url}/repos/{ARGO_REPO_OWNER}/{ARGO_REPO_NAME}"
+        self._argo_contents_url = f"{self._argo_repo_url}/contents"
+        # Argo 레포 기본값은 메인 레포이므로 이 경우 모델 YAML과 Argo 파일을 한 커밋으로 반영
+        self.argo_shares_repo = self._argo_repo_url == self._repo_url
         self.headers = {
             'Authorization': f'Bearer {config.token}',
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'MLflow-GitHub-Integration/1.0'
         }
         
+        # keep-alive 연결을 재사용하고 rate limit 헤더를 따르는 세션 (기본 헤더는 세션에 한 번만 설정)
+        self.session = RateLimitedSession(GitHubRateLimiter())
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=GITHUB_POOL_CONNECTIONS,
+            pool_maxsize=GITHUB_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=GITHUB_MAX_RETRIES,
+                backoff_factor=GITHUB_RETRY_BACKOFF,
+                status_forcelist=GITHUB_RETRY_STATUSES,
+                # 멱등 요청만 자동 재시도 (commit 생성 POST를 재시도하면 중복 커밋이 생기고,
+                # ref PATCH를 재시도하면 브랜치 이동으로 인한 422가 가려짐)
+                allowed_methods=frozenset(['HEAD', 'GET', 'PUT']),
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        
+        # 템플릿 파일은 거의 바뀌지 않으므로 디코딩한 내용을 (contents URL, path, branch)별로 TTL 동안 캐시
+        self._template_cache: Dict[Tuple[str, str, str], Tuple[float, str]] = {}
+        # Argo 템플릿의 파싱된 format 구조 (템플릿 내용별)
+        self._parsed_template_cache: Dict[str, List[Tuple[str, Optional[str], str, Optional[str]]]] = {}
+        
+        # 모델 YAML 렌더링 결과 (엔진, 모델명)별: (템플릿 내용, 최상위 키별 직렬화 결과, global 섹션)
+        # 같은 템플릿/모델이면 실행마다 달라지는 것은 global 섹션뿐이므로 그 부분만 다시 직렬화
+        self._model_yaml_cache: Dict[Tuple[str, str], Tuple[str, List[Tuple[str, Optional[str]]], Dict]] = {}
+        
+        # 조건부 GET용 (URL, branch)별 마지막 ETag와 응답 본문 (304면 본문 재사용)
+        self._etag_cache: Dict[Tuple[str, str], Tuple[str, Dict]] = {}
+        
+        # 서로 독립적인 GitHub 조회를 동시에 실행하기 위한 스레드 풀
+        self._executor = ThreadPoolExecutor(max_workers=GITHUB_MAX_WORKERS, thread_name_prefix="github")
+        
         # Initialize processors
         self.processors = {
             'vllm': VLLMProcessor(BENCHMARK_EVAL_URL),
             'tensorrt-llm': TensorRTLLMProcessor(BENCHMARK_EVAL_URL)
         }
     
-    def get_file_content(self, file_path: str, branch: str = "main") -> Optional[Dict]:
+    def _get_contents(self, contents_url: str, file_path: str, branch: str = "main",
+                      failure_level: int = logging.DEBUG, failed=None) -> Optional[Dict]:
         """
-        GitHub에서 파일 내용 가져오기
+        contents API로 파일 정보 가져오기 (레포별 get_*_file_content 공통 구현)
         
         Args:
+            contents_url: 레포의 contents API URL
             file_path: 파일 경로
             branch: 브랜치명
+            failure_level: 실패 로그 레벨
+            failed: 404가 아닌 오류(네트워크, rate limit, 파싱 실패)일 때 반환할 값
             
         Returns:
-            파일 정보 딕셔너리 또는 None
+            파일 정보 딕셔너리, 파일이 없으면(404) None, 조회 실패 시 failed
         """
+        url = f"{contents_url}/{file_path}"
+        key = (url, branch)
+        cached = self._etag_cache.get(key)
         try:
-            url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}/contents/{file_path}"
-            params = {'ref': branch}
-            
-            response = requests.get(url, headers=self.headers, params=params)
+            # 이전 ETag를 보내 변경이 없으면 본문 없는 304 응답을 받음
+            headers = {'If-None-Match': cached[0]} if cached else None
+            response = self.session.get(url, params=MAIN_REF_PARAMS if branch == 'main' else {'ref': branch}, headers=headers)
+            if cached and response.status_code == 304:
+                logger.debug(f"파일 변경 없음 (304): {url}")
+                return cached[1]
             response.raise_for_status()
             
-            logger.debug(f"파일 내용 가져오기 성공: {file_path}")
-            return response.json()
+            file_info = orjson.loads(response.content)
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[key] = (etag, file_info)
             
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"파일 내용 가져오기 실패: {file_path} - {e}")
-            return None
+            logger.debug(f"파일 내용 가져오기 성공: {url}")
+            return file_info
+            
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.log(failure_level, f"파일 내용 가져오기 실패: {url} - {e}")
+            if isinstance(e, requests.exceptions.HTTPError) and e.response is not None and e.response.status_code == 404:
+                return None
+            return failed
     
-    def get_template_file_content(self, file_path: str, branch: str = "main") -> Optional[Dict]:
+    def _put_contents(self, contents_url: str, file_update: GitHubFileUpdate) -> Optional[Dict]:
         """
-        템플릿 레포에서 파일 내용 가져오기
+        contents API로 파일 생성/업데이트 (레포별 update_*file 공통 구현)
         
         Args:
-            file_path: 파일 경로
-            branch: 브랜치명
+            contents_url: 레포의 contents API URL
+            file_update: 파일 업데이트 정보
             
         Returns:
-            파일 정보 딕셔너리 또는 None
+            업데이트 결과 딕셔너리 또는 None
         """
+        url = f"{contents_url}/{file_update.file_path}"
         try:
-            url = f"{self.base_url}/repos/{TEMPLATE_REPO_OWNER}/{TEMPLATE_REPO_NAME}/contents/{file_path}"
-            params = {'ref': branch}
+            # 콘텐츠를 base64로 인코딩 (base64 출력은 ASCII이므로 ASCII로 디코딩)
+            content_encoded = base64.b64encode(file_update.content.encode('utf-8')).decode('ascii')
             
-            response = requests.get(url, headers=self.headers, params=params)
+            data = {
+                'message': file_update.commit_message,
+                'content': content_encoded,
+                'branch': file_update.branch
+            }
+            if file_update.sha:
+                data['sha'] = file_update.sha
+            
+            response = self.session.put(url, data=orjson.dumps(data), headers=JSON_CONTENT_HEADERS)
+            if response.status_code in STALE_SHA_STATUSES:
+                # 조회 이후 다른 쪽이 파일을 바꿨거나(409) 만들었음(422)
+                # 이미 같은 내용이면 성공으로 보고, 다르면 덮어쓰지 않고 충돌로 실패 처리
+                current = self._get_contents(contents_url, file_update.file_path, file_update.branch)
+                if current and current.get('sha') == git_blob_sha(file_update.content):
+                    logger.debug(f"파일이 이미 같은 내용으로 갱신되어 있습니다: {url}")
+                    return {'content': current}
+                logger.warning(f"파일 sha 충돌, 다른 변경을 덮어쓰지 않도록 업데이트 중단: {url}")
             response.raise_for_status()
             
-            logger.debug(f"템플릿 파일 내용 가져오기 성공: {file_path} from {TEMPLATE_REPO_OWNER}/{TEMPLATE_REPO_NAME}")
-            return response.json()
+            logger.debug(f"파일 업데이트 성공: {url}")
+            return orjson.loads(response.content)
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"템플릿 파일 내용 가져오기 실패: {file_path} from {TEMPLATE_REPO_OWNER}/{TEMPLATE_REPO_NAME} - {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.debug(f"파일 업데이트 실패: {url} - {e}")
             return None
     
+    def get_file_content(self, file_path: str, branch: str = "main", failed=None) -> Optional[Dict]:
+        """GitHub에서 파일 내용 가져오기 (조회 실패 시 failed 반환)"""
+        return self._get_contents(self._contents_url, file_path, branch, failed=failed)
+    
+    def get_file_contents(self, file_paths: List[str], branch: str = "main") -> List[Optional[Dict]]:
+        """
+        여러 파일 내용을 스레드 풀에서 동시에 가져오기 (입력 순서대로 반환)
+        
+        파일이 없으면 None, 404가 아닌 오류로 조회하지 못한 파일은 LOOKUP_FAILED
+        """
+        return list(self._executor.map(lambda file_path: self.get_file_content(file_path, branch, LOOKUP_FAILED), file_paths))
+    
+    def get_template_file_content(self, file_path: str, branch: str = "main") -> Optional[Dict]:
+        """템플릿 레포에서 파일 내용 가져오기"""
+        return self._get_contents(self._template_contents_url, file_path, branch, failure_level=logging.ERROR)
+    
     def get_argo_file_content(self, file_path: str, branch: str = "main") -> Optional[Dict]:
+        """Argo 레포에서 파일 내용 가져오기"""
+        return self._get_contents(self._argo_contents_url, file_path, branch)
+    
+    def _get_template_text(self, contents_url: str, file_path: str, branch: str = "main") -> Optional[str]:
         """
-        Argo 레포에서 파일 내용 가져오기
+        템플릿 파일을 디코딩된 문자열로 가져오기 (TTL 안에서는 캐시에서 반환)
         
         Args:
+            contents_url: 템플릿 레포의 contents API URL
             file_path: 파일 경로
             branch: 브랜치명
             
         Returns:
-            파일 정보 딕셔너리 또는 None
+            템플릿 내용 또는 None
         """
+        key = (contents_url, file_path, branch)
+        now = time.monotonic()
+        cached = self._template_cache.get(key)
+        if cached is not None and now - cached[0] < GITHUB_TEMPLATE_CACHE_TTL:
+            return cached[1]
+        
+        # 만료 후 재조회는 ETag 조건부 요청이라 변경이 없으면 304로 끝남
+        file_info = self._get_contents(contents_url, file_path, branch, failure_level=logging.ERROR)
+        if not file_info:
+            return None
         try:
-            url = f"{self.base_url}/repos/{ARGO_REPO_OWNER}/{ARGO_REPO_NAME}/contents/{file_path}"
-            params = {'ref': branch}
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            
-            logger.debug(f"Argo 파일 내용 가져오기 성공: {file_path} from {ARGO_REPO_OWNER}/{ARGO_REPO_NAME}")
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Argo 파일 내용 가져오기 실패: {file_path} from {ARGO_REPO_OWNER}/{ARGO_REPO_NAME} - {e}")
+            template = decode_github_content(file_info['content'])
+        except (KeyError, binascii.Error, UnicodeDecodeError) as e:
+            logger.error(f"템플릿 파일 디코딩 실패: {file_path} - {e}")
             return None
+        
+        # 템플릿이 바뀌었으면 이전 내용의 파싱 결과는 더 이상 쓰이지 않음
+        if cached is not None and cached[1] != template:
+            self._parsed_template_cache.pop(cached[1], None)
+        self._template_cache[key] = (now, template)
+        return template
     
-    def update_argo_file(self, file_update: GitHubFileUpdate) -> Optional[Dict]:
+    def _get_argo_template_and_file(self, template_path: str, file_path: str) -> Tuple[Optional[str], Optional[Dict]]:
         """
-        Argo 레포에서 파일 업데이트
+        Argo 템플릿(디코딩된 내용)과 기존 파일 정보를 동시에 가져오기
         
         Args:
-            file_update: 파일 업데이트 정보
+            template_path: 템플릿 파일 경로
+            file_path: 생성/업데이트할 파일 경로
             
         Returns:
-            업데이트 결과 딕셔너리 또는 None
+            (템플릿 내용 또는 None, 기존 파일 정보 또는 None)
         """
-        try:
-            url = f"{self.base_url}/repos/{ARGO_REPO_OWNER}/{ARGO_REPO_NAME}/contents/{file_update.file_path}"
-            
-            # 콘텐츠를 base64로 인코딩
-            content_encoded = base64.b64encode(file_update.content.encode('utf-8')).decode('utf-8')
-            
-            data = {
-                'message': file_update.commit_message,
-                'content': content_encoded,
-                'branch': file_update.branch
-            }
-            
-            response = requests.put(url, headers=self.headers, json=data)
-            response.raise_for_status()
-            
-            logger.debug(f"Argo 파일 업데이트 성공: {file_update.file_path} to {ARGO_REPO_OWNER}/{ARGO_REPO_NAME}")
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Argo 파일 업데이트 실패: {file_update.file_path} to {ARGO_REPO_OWNER}/{ARGO_REPO_NAME} - {e}")
-            return None
+        template_future = self._executor.submit(self._get_template_text, self._argo_contents_url, template_path)
+        existing_future = self._executor.submit(self.get_argo_file_content, file_path)
+        return template_future.result(), existing_future.result()
     
-    def update_file(self, file_update: GitHubFileUpdate) -> Optional[Dict]:
+    def _render_template(self, template: str, **kwargs) -> str:
         """
-        GitHub에서 파일 업데이트
+        Argo 템플릿 placeholder 채우기 (format 구조는 템플릿별로 한 번만 파싱)
         
         Args:
-            file_update: 파일 업데이트 정보
+            template: str.format 형식의 템플릿 내용
+            **kwargs: placeholder 값
             
         Returns:
-            업데이트 결과 딕셔너리 또는 None
+            채워진 내용
         """
-        try:
-            url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}/contents/{file_update.file_path}"
-            
-            # 콘텐츠를 base64로 인코딩
-            content_encoded = base64.b64encode(file_update.content.encode('utf-8')).decode('utf-8')
-            
-            data = {
-                'message': file_update.commit_message,
-                'content': content_encoded,
-                'branch': file_update.branch
-            }
-            
-            response = requests.put(url, headers=self.headers, json=data)
-            response.raise_for_status()
-            
-            logger.debug(f"파일 업데이트 성공: {file_update.file_path}")
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"파일 업데이트 실패: {file_update.file_path} - {e}")
-            return None
+        parsed = self._parsed_template_cache.get(template)
+        if parsed is None:
+            parsed = parse_format_template(template)
+            self._parsed_template_cache[template] = parsed
+        return render_format_template(parsed, **kwargs)
+    
+    def clear_template_cache(self) -> None:
+        """템플릿 캐시 비우기 (템플릿 레포 변경 후 강제 새로고침용)"""
+        self._template_cache.clear()
+        self._parsed_template_cache.clear()
+        self._model_yaml_cache.clear()
     
-    def update_yaml_models(self, engine_type: str, run_id: str, model_name: str, version: str, experiment_id: str = "1", model_id: str = None, existing_file: Optional[Dict] = None) -> bool:
+    def update_argo_file(self, file_update: GitHubFileUpdate) -> Optional[Dict]:
+        """Argo 레포에서 파일 업데이트"""
+        return self._put_contents(self._argo_contents_url, file_update)
+    
+    def update_file(self, file_update: GitHubFileUpdate) -> Optional[Dict]:
+        """GitHub에서 파일 업데이트"""
+        return self._put_contents(self._contents_url, file_update)
+    
+    def update_yaml_models(self, engine_type: str, run_id: str, model_name: str, version: str, experiment_id: str = "1", model_id: str = None, existing_file: Optional[Dict] = None, timestamp: Optional[str] = None) -> bool:
         """
         model_name.yaml 파일의 global 섹션(experimentId, runid, timestamp) 업데이트
         
@@ -184,48 +422,157 @@ class GitHubClient:
             model_name: 모델 이름
             version: 모델 버전
             experiment_id: MLflow 실험 ID
+            existing_file: 호출자가 이미 조회한 기존 파일 정보 (없으면 새 파일로 생성)
+            timestamp: global.timestamp 값 (여러 모델을 한 번에 갱신할 때 호출자가 한 번만 계산)
             
         Returns:
             업데이트 성공 여부
         """
-        try:
-            from datetime import datetime
-            
-            success_count = 0
+        success, file_update = self._build_yaml_model_update(engine_type, run_id, model_name, version, experiment_id, model_id, existing_file, timestamp)
+        if file_update is None:
+            return success
+        
+        # 네트워크 오류는 update_file에서 처리되어 None으로 반환됨
+        if not self.update_file(file_update):
+            logger.error(f"GitHub 레포의 {engine_type}/{model_name}.yaml 업데이트 실패")
+            return False
+        
+        logger.info(f"GitHub 레포의 {engine_type}/{model_name}.yaml 업데이트 완료")
+        return True
+    
+    def bulk_update_yaml_models(self, model_updates: List[Dict]) -> List[bool]:
+        """
+        여러 모델 YAML을 하나의 커밋으로 갱신 (모델마다 contents PUT 커밋을 만들지 않음)
+        
+        Args:
+            model_updates: update_yaml_models 인자(engine_type, run_id, model_name, version, ...) 딕셔너리 목록.
+                deploy_argo=True인 모델은 Argo 레포가 같은 레포이면(argo_shares_repo) AppProject/Application도 같은 커밋에 포함
             
-            engine_yaml_path = get_yaml_model_file_path(engine_type)
-            if engine_yaml_path:
-                yaml_file_path = f"{engine_yaml_path}/{model_name}.yaml"
-            else:
-                yaml_file_path = f"{model_name}.yaml"
+        Returns:
+            입력 순서대로 각 모델의 업데이트(같은 커밋에 포함한 Argo 파일 포함) 성공 여부
+        """
+        results = []
+        # 경로별 파일 업데이트 (여러 모델이 공유하는 AppProject는 한 번만 포함)
+        file_updates: Dict[str, GitHubFileUpdate] = {}
+        model_paths = []  # 모델별로 커밋 결과를 기다리는 파일 경로
+        for kwargs in model_updates:
+            kwargs = dict(kwargs)
+            deploy_argo = kwargs.pop('deploy_argo', False) and self.argo_shares_repo
+            success, file_update = self._build_yaml_model_update(**kwargs)
+            paths = []
+            if file_update is not None:
+                file_updates[file_update.file_path] = file_update
+                paths.append(file_update.file_path)
+            if success and deploy_argo:
+                success, argo_updates = self._build_argo_deploy_updates(kwargs['engine_type'], kwargs['model_name'])
+                for update in argo_updates:
+                    file_updates.setdefault(update.file_path, update)
+                    paths.append(update.file_path)
+            results.append(success)
+            model_paths.append(paths)
+        
+        if not file_updates:
+            return results
+        
+        # 조회 이후 다른 쪽이 바꾼 파일은 덮어쓰지 않고 제외한 채 나머지만 커밋
+        conflicts = []
+        committed = self._commit_files(self._repo_url, list(file_updates.values()), self._batch_commit_message, conflicts=conflicts) is not None
+        for index, paths in enumerate(model_paths):
+            if paths:
+                results[index] = results[index] and committed and not any(path in conflicts for path in paths)
+        if committed:
+            logger.info(f"GitHub 레포의 파일 {len(file_updates) - len(conflicts)}개 업데이트 완료")
+        return results
+    
+    @staticmethod
+    def _batch_commit_message(file_updates: List[GitHubFileUpdate]) -> str:
+        """모델 YAML(과 Argo 파일) 일괄 커밋 메시지 (실제로 커밋하는 파일 기준)"""
+        if len(file_updates) == 1:
+            return file_updates[0].commit_message
+        return f"Update {len(file_updates)} files\n\n" + "\n".join(update.commit_message for update in file_updates)
+    
+    def _build_yaml_model_update(self, engine_type: str, run_id: str, model_name: str, version: str, experiment_id: str = "1", model_id: str = None, existing_file: Optional[Dict] = None, timestamp: Optional[str] = None) -> Tuple[bool, Optional[GitHubFileUpdate]]:
+        """
+        모델 YAML 파일 업데이트 정보 생성 (GitHub에 쓰지 않음)
+        
+        Returns:
+            (성공 여부, 파일 업데이트 정보 - 기존 파일과 동일하거나 실패하면 None)
+        """
+        engine_yaml_path = get_yaml_model_file_path(engine_type)
+        if engine_yaml_path:
+            yaml_file_path = f"{engine_yaml_path}/{model_name}.yaml"
+        else:
+            yaml_file_path = f"{model_name}.yaml"
+        
+        # 각 엔진별 템플릿 처리 및 YAML 직렬화
+        try:
+            updated_content = self._render_model_yaml(engine_type, run_id, experiment_id, model_name, version, model_id, timestamp)
+        except yaml.YAMLError as e:
+            logger.error(f"{engine_type}/{model_name}.yaml 직렬화 실패: {e}")
+            return False, None
+        if updated_content is None:
+            logger.error(f"템플릿을 가져올 수 없어 {engine_type}/{model_name}.yaml 파일을 생성할 수 없습니다.")
+            return False, None
+        
+        # 내용이 같으면 PUT 생략 (기존 파일을 디코딩하지 않고 blob sha로 비교)
+        if existing_file and existing_file.get('sha') == git_blob_sha(updated_content):
+            logger.debug(f"{engine_type}/{model_name}.yaml이 이미 동일한 내용으로 존재합니다")
+            return True, None
+        
+        commit_message = f"Update {model_name} ({engine_type}) - version: {version}, runid: {run_id}"
+        
+        return True, GitHubFileUpdate(
+            file_path=yaml_file_path,
+            content=updated_content,
+            commit_message=commit_message,
+            sha=existing_file['sha'] if existing_file else None
+        )
+
+    def _render_model_yaml(self, engine_type: str, run_id: str, experiment_id: str, model_name: str, version: str, model_id: str = None, timestamp: Optional[str] = None) -> Optional[str]:
+        """
+        모델 YAML 내용 생성 (템플릿과 모델이 같으면 global 섹션만 다시 직렬화)
+        
+        Args:
+            engine_type: 엔진 타입
+            run_id: MLflow 실행 ID
+            experiment_id: MLflow 실험 ID
+            model_name: 모델 이름
+            version: 모델 버전
+            model_id: 모델 ID
+            timestamp: global.timestamp 값 (없으면 현재 시각)
             
-            # 각 엔진별 템플릿 처리
-            yaml_data = self._get_yaml_template_for_engine(run_id, experiment_id, model_name, version, model_id, engine_type)
+        Returns:
+            YAML 문자열 또는 None
+        """
+        if engine_type not in self.processors:
+            logger.error(f"지원하지 않는 엔진 타입: {engine_type}")
+            return None
+        
+        template_path = get_yaml_template_path(engine_type)
+        template = self._get_template_text(self._template_contents_url, template_path)
+        if template is None:
+            logger.error(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
+            return None
+        
+        key = (engine_type, model_name)
+        cached = self._model_yaml_cache.get(key)
+        if cached is None or cached[0] != template:
+            # 첫 생성이거나 템플릿이 바뀐 경우: 전체 파싱/처리 후 최상위 키별로 직렬화해 둠
+            yaml_data = self._get_yaml_template_for_engine(run_id, experiment_id, model_name, version, model_id, engine_type, timestamp)
             if not yaml_data:
-                logger.error(f"템플릿을 가져올 수 없어 {engine_type}/{model_name}.yaml 파일을 생성할 수 없습니다.")
-                return False
-            
-            # YAML 직렬화 및 파일 업데이트
-            updated_content = yaml.dump(yaml_data, default_flow_style=False, allow_unicode=True, sort_keys=False)
-            commit_message = f"Update {model_name} ({engine_type}) - version: {version}, runid: {run_id}"
-            
-            file_update = GitHubFileUpdate(
-                file_path=yaml_file_path,
-                content=updated_content,
-                commit_message=commit_message
-            )
-            
-            result = self.update_file(file_update)
-            if result:
-                logger.info(f"GitHub 레포의 {engine_type}/{model_name}.yaml 업데이트 완료")
-                success_count += 1
-            
-            return success_count == 1
-                
-        except Exception as e:
-            logger.error(f"YAML 파일 업데이트 중 오류 발생: {e}")
-            return False
-
+                return None
+            # 블록 스타일에서는 최상위 키를 따로 직렬화해 이어 붙여도 전체 직렬화와 결과가 같음
+            parts = [(k, None if k == 'global' else yaml.dump({k: v}, **YAML_DUMP_KWARGS)) for k, v in yaml_data.items()]
+            cached = (template, parts, yaml_data['global'])
+            self._model_yaml_cache[key] = cached
+        
+        # global 섹션만 새 값으로 갱신해서 직렬화
+        global_data = {'global': dict(cached[2])}
+        self.processors[engine_type]._update_global_section(global_data, model_name, run_id, experiment_id, model_id, version, timestamp)
+        global_text = yaml.dump(global_data, **YAML_DUMP_KWARGS)
+        
+        return ''.join(global_text if text is None else text for _, text in cached[1])
+    
     def add_model_to_argo_application(self, engine_type: str, model_name: str, project_name: str = None, repo_url: str = None, namespace: str = None) -> bool:
         """
         ArgoCD Application 템플릿을 사용해서 새로운 모델용 Application 생성
@@ -239,29 +586,19 @@ class GitHubClient:
         Returns:
             생성 성공 여부
         """
-        try:
-            # 기본값 설정
-            if project_name is None:
-                project_name = ARGOCD_PROJECT_NAME
-            if repo_url is None:
-                repo_url = ARGOCD_REPO_URL
-            if namespace is None:
-                namespace = ARGOCD_NAMESPACE
-            
-            success_count = 0
-            
-            if engine_type in self.processors:
-                success = self._create_single_argo_application(model_name, engine_type, project_name, repo_url, namespace)
-                if success:
-                    success_count += 1
-            else:
-                logger.error(f"지원하지 않는 inference engine type: {engine_type}")
-            
-            return success_count == 1
-                    
-        except Exception as e:
-            logger.error(f"ArgoCD Application 추가 중 오류 발생: {e}")
+        # 기본값 설정
+        if project_name is None:
+            project_name = ARGOCD_PROJECT_NAME
+        if repo_url is None:
+            repo_url = ARGOCD_REPO_URL
+        if namespace is None:
+            namespace = ARGOCD_NAMESPACE
+        
+        if engine_type not in self.processors:
+            logger.error(f"지원하지 않는 inference engine type: {engine_type}")
             return False
+        
+        return self._create_single_argo_application(model_name, engine_type, project_name, repo_url, namespace)
 
     def _create_single_argo_application(self, model_name: str, engine_type: str, project_name: str, repo_url: str, namespace: str) -> bool:
         """
@@ -277,28 +614,47 @@ class GitHubClient:
         Returns:
             생성 성공 여부
         """
-        try:
-            processor = self.processors[engine_type]
-            application_name = processor.get_application_name(model_name)
-            
-            if ARGO_APPLICATION_PATH:
-                application_file_path = f"{ARGO_APPLICATION_PATH}/{application_name}.yaml"
-            else:
-                application_file_path = f"{application_name}.yaml"
-            value_file = f"{model_name}"
-            
-            # ArgoCD Application 템플릿에서 가져오기
-            template_info = self.get_argo_file_content(ARGO_FILE_PATH)
-            
-            if not template_info:
-                logger.error(f"Argo 레포에서 ArgoCD Application 템플릿을 찾을 수 없습니다: {ARGO_FILE_PATH}")
-                return False
-            
-            # 템플릿 내용 디코딩
-            template_content = base64.b64decode(template_info['content']).decode('utf-8')
+        success, file_update = self._build_argo_application_update(model_name, engine_type, project_name, repo_url, namespace)
+        if file_update is None:
+            return success
+        
+        # 네트워크 오류는 update_argo_file에서 처리되어 None으로 반환됨
+        return self.update_argo_file(file_update) is not None
+    
+    def _build_argo_application_update(self, model_name: str, engine_type: str, project_name: str, repo_url: str, namespace: str) -> Tuple[bool, Optional[GitHubFileUpdate]]:
+        """
+        ArgoCD Application 파일 업데이트 정보 생성 (GitHub에 쓰지 않음)
+        
+        Args:
+            model_name: 모델 이름
+            engine_type: 엔진 타입
+            project_name: ArgoCD 프로젝트 이름
+            repo_url: Git 레포 URL
+            namespace: Kubernetes 네임스페이스
             
-            # 템플릿 placeholder 채우기
-            application_content = template_content.format(
+        Returns:
+            (성공 여부, 파일 업데이트 정보 - 기존 파일과 동일하거나 실패하면 None)
+        """
+        processor = self.processors[engine_type]
+        application_name = processor.get_application_name(model_name)
+        
+        if ARGO_APPLICATION_PATH:
+            application_file_path = f"{ARGO_APPLICATION_PATH}/{application_name}.yaml"
+        else:
+            application_file_path = f"{application_name}.yaml"
+        value_file = f"{model_name}"
+        
+        # ArgoCD Application 템플릿(캐시 사용)과 기존 파일을 동시에 가져오기
+        template_content, existing_file_info = self._get_argo_template_and_file(ARGO_FILE_PATH, application_file_path)
+        
+        if template_content is None:
+            logger.error(f"Argo 레포에서 ArgoCD Application 템플릿을 찾을 수 없습니다: {ARGO_FILE_PATH}")
+            return False, None
+        
+        # 템플릿 placeholder 채우기
+        try:
+            application_content = self._render_template(
+                template_content,
                 path=engine_type,
                 application_name=application_name,
                 project_name=project_name,
@@ -306,37 +662,28 @@ class GitHubClient:
                 value_file=value_file,
                 namespace=namespace
             )
-            
-            # 기존 파일이 있는지 확인
-            existing_file_info = self.get_argo_file_content(application_file_path)
-            
-            if existing_file_info:
-                # 기존 내용과 비교
-                existing_content = base64.b64decode(existing_file_info['content']).decode('utf-8')
-                if existing_content.strip() == application_content.strip():
-                    logger.debug(f"ArgoCD Application이 이미 동일한 내용으로 존재합니다: {application_file_path}")
-                    return True
-            
-            # 커밋 메시지 생성
-            action = "Update" if existing_file_info else "Create"
-            commit_message = f"{action} ArgoCD Application for {model_name}"
-            
-            # 파일 업데이트/생성
-            file_update = GitHubFileUpdate(
-                file_path=application_file_path,
-                content=application_content,
-                commit_message=commit_message
-            )
-            
-            result = self.update_argo_file(file_update)
-            
-            if result:
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            return False
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"ArgoCD Application 템플릿 placeholder 처리 실패: {ARGO_FILE_PATH} - {e}")
+            return False, None
+        
+        # 기존 파일과 내용이 같으면 생략 (기존 파일을 디코딩하지 않고 blob sha로 비교)
+        if existing_file_info and existing_file_info.get('sha') == git_blob_sha(application_content):
+            logger.debug(f"ArgoCD Application이 이미 동일한 내용으로 존재합니다: {application_file_path}")
+            return True, None
+        
+        # 커밋 메시지 생성
+        action = "Update" if existing_file_info else "Create"
+        commit_message = f"{action} ArgoCD Application for {model_name}"
+        
+        # 파일 업데이트/생성
+        file_update = GitHubFileUpdate(
+            file_path=application_file_path,
+            content=application_content,
+            commit_message=commit_message,
+            sha=existing_file_info['sha'] if existing_file_info else None
+        )
+        
+        return True, file_update
     
     def create_argo_project(self, project_name: str = None, repo_url: str = None, namespace: str = None) -> bool:
         """
@@ -350,70 +697,242 @@ class GitHubClient:
         Returns:
             생성 성공 여부
         """
-        try:
-            # 기본값 설정
-            if project_name is None:
-                project_name = ARGOCD_PROJECT_NAME
-            if repo_url is None:
-                repo_url = ARGOCD_REPO_URL
-            if namespace is None:
-                namespace = ARGOCD_NAMESPACE
-            
-            # Project 파일명 생성
-            if ARGO_PROJECT_PATH:
-                project_file_path = f"{ARGO_PROJECT_PATH}/{project_name}.yaml"
-            else:
-                project_file_path = f"{project_name}.yaml"
-            
-            # ArgoCD AppProject 템플릿에서 가져오기
-            template_info = self.get_argo_file_content(ARGO_PROJECT_TEMPLATE_PATH)
-            
-            if not template_info:
-                logger.error(f"Argo 레포에서 ArgoCD AppProject 템플릿을 찾을 수 없습니다: {ARGO_PROJECT_TEMPLATE_PATH}")
-                return False
-            
-            # 템플릿 내용 디코딩
-            template_content = base64.b64decode(template_info['content']).decode('utf-8')
+        # 기본값 설정
+        if project_name is None:
+            project_name = ARGOCD_PROJECT_NAME
+        if repo_url is None:
+            repo_url = ARGOCD_REPO_URL
+        if namespace is None:
+            namespace = ARGOCD_NAMESPACE
+        
+        success, file_update = self._build_argo_project_update(project_name, repo_url, namespace)
+        if file_update is None:
+            return success
+        
+        # 네트워크 오류는 update_argo_file에서 처리되어 None으로 반환됨
+        return self.update_argo_file(file_update) is not None
+    
+    def _build_argo_project_update(self, project_name: str, repo_url: str, namespace: str) -> Tuple[bool, Optional[GitHubFileUpdate]]:
+        """
+        ArgoCD AppProject 파일 업데이트 정보 생성 (GitHub에 쓰지 않음)
+        
+        Args:
+            project_name: ArgoCD 프로젝트 이름
+            repo_url: Git 레포 URL
+            namespace: Kubernetes 네임스페이스
             
-            # 템플릿 placeholder 채우기
-            project_content = template_content.format(
+        Returns:
+            (성공 여부, 파일 업데이트 정보 - 기존 파일과 동일하거나 실패하면 None)
+        """
+        # Project 파일명 생성
+        if ARGO_PROJECT_PATH:
+            project_file_path = f"{ARGO_PROJECT_PATH}/{project_name}.yaml"
+        else:
+            project_file_path = f"{project_name}.yaml"
+        
+        # ArgoCD AppProject 템플릿(캐시 사용)과 기존 파일을 동시에 가져오기
+        template_content, existing_file_info = self._get_argo_template_and_file(ARGO_PROJECT_TEMPLATE_PATH, project_file_path)
+        
+        if template_content is None:
+            logger.error(f"Argo 레포에서 ArgoCD AppProject 템플릿을 찾을 수 없습니다: {ARGO_PROJECT_TEMPLATE_PATH}")
+            return False, None
+        
+        # 템플릿 placeholder 채우기
+        try:
+            project_content = self._render_template(
+                template_content,
                 project_name=project_name,
                 repo_url=repo_url,
                 namespace=namespace
             )
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"ArgoCD AppProject 템플릿 placeholder 처리 실패: {ARGO_PROJECT_TEMPLATE_PATH} - {e}")
+            return False, None
+        
+        # 기존 파일과 내용이 같으면 생략 (기존 파일을 디코딩하지 않고 blob sha로 비교)
+        if existing_file_info and existing_file_info.get('sha') == git_blob_sha(project_content):
+            logger.debug(f"ArgoCD AppProject가 이미 동일한 내용으로 존재합니다: {project_file_path}")
+            return True, None
+        
+        # 커밋 메시지 생성
+        action = "Update" if existing_file_info else "Create"
+        commit_message = f"{action} ArgoCD AppProject: {project_name}"
+        
+        # 파일 업데이트/생성
+        file_update = GitHubFileUpdate(
+            file_path=project_file_path,
+            content=project_content,
+            commit_message=commit_message,
+            sha=existing_file_info['sha'] if existing_file_info else None
+        )
+        
+        return True, file_update
+    
+    def deploy_model_to_argo(self, engine_type: str, model_name: str, project_name: str = None, repo_url: str = None, namespace: str = None) -> bool:
+        """
+        ArgoCD AppProject와 모델용 Application을 한 커밋으로 생성/업데이트
+        
+        Args:
+            engine_type: 엔진 타입
+            model_name: 모델 이름
+            project_name: ArgoCD 프로젝트 이름
+            repo_url: Git 레포 URL
+            namespace: Kubernetes 네임스페이스
             
-            # 기존 파일이 있는지 확인
-            existing_file_info = self.get_argo_file_content(project_file_path)
-            
-            if existing_file_info:
-                # 기존 내용과 비교
-                existing_content = base64.b64decode(existing_file_info['content']).decode('utf-8')
-                if existing_content.strip() == project_content.strip():
-                    logger.debug(f"ArgoCD AppProject가 이미 동일한 내용으로 존재합니다: {project_file_path}")
-                    return True
-            
-            # 커밋 메시지 생성
-            action = "Update" if existing_file_info else "Create"
-            commit_message = f"{action} ArgoCD AppProject: {project_name}"
-            
-            # 파일 업데이트/생성
-            file_update = GitHubFileUpdate(
-                file_path=project_file_path,
-                content=project_content,
-                commit_message=commit_message
-            )
-            
-            result = self.update_argo_file(file_update)
+        Returns:
+            생성 성공 여부
+        """
+        success, file_updates = self._build_argo_deploy_updates(engine_type, model_name, project_name, repo_url, namespace)
+        if not success:
+            return False
+        if not file_updates:
+            logger.debug(f"ArgoCD AppProject/Application이 이미 동일한 내용으로 존재합니다: {project_name or ARGOCD_PROJECT_NAME} - {model_name}")
+            return True
+        
+        commit_message = "; ".join(update.commit_message for update in file_updates)
+        return self.commit_argo_files(file_updates, commit_message) is not None
+    
+    def _build_argo_deploy_updates(self, engine_type: str, model_name: str, project_name: str = None, repo_url: str = None, namespace: str = None) -> Tuple[bool, List[GitHubFileUpdate]]:
+        """
+        ArgoCD AppProject와 모델용 Application 파일 업데이트 정보 생성 (GitHub에 쓰지 않음)
+        
+        Returns:
+            (성공 여부, 변경이 필요한 파일 업데이트 정보 목록)
+        """
+        # 기본값 설정
+        if project_name is None:
+            project_name = ARGOCD_PROJECT_NAME
+        if repo_url is None:
+            repo_url = ARGOCD_REPO_URL
+        if namespace is None:
+            namespace = ARGOCD_NAMESPACE
+        
+        if engine_type not in self.processors:
+            logger.error(f"지원하지 않는 inference engine type: {engine_type}")
+            return False, []
+        
+        # 각 빌더가 템플릿/기존 파일 조회를 스레드 풀에서 동시에 실행하므로 빌더 자체는 순서대로 호출
+        # (빌더를 다시 풀에 넣으면 작업이 서로를 기다리며 풀이 고갈될 수 있음)
+        project_success, project_update = self._build_argo_project_update(project_name, repo_url, namespace)
+        if not project_success:
+            logger.error(f"ArgoCD AppProject 생성 실패: {project_name}")
+            return False, []
+        application_success, application_update = self._build_argo_application_update(model_name, engine_type, project_name, repo_url, namespace)
+        if not application_success:
+            logger.error(f"ArgoCD Application 생성 실패: {project_name} - {model_name}")
+            return False, []
+        
+        return True, [update for update in (project_update, application_update) if update is not None]
+    
+    def commit_argo_files(self, file_updates: List[GitHubFileUpdate], commit_message: str, branch: str = "main") -> Optional[Dict]:
+        """Argo 레포에 여러 파일을 하나의 커밋으로 반영"""
+        return self._commit_files(self._argo_repo_url, file_updates, commit_message, branch)
+    
+    def _commit_files(self, repo_url: str, file_updates: List[GitHubFileUpdate],
+                      commit_message: Union[str, Callable[[List[GitHubFileUpdate]], str]], branch: str = "main",
+                      conflicts: Optional[List[str]] = None) -> Optional[Dict]:
+        """
+        Git Data API로 여러 파일을 하나의 커밋으로 반영 (파일별 contents PUT 대신)
+        
+        Args:
+            repo_url: 레포 API URL
+            file_updates: 파일 업데이트 정보 목록
+            commit_message: 커밋 메시지 (또는 실제로 커밋할 파일 목록으로 메시지를 만드는 함수)
+            branch: 브랜치명
+            conflicts: 주어지면 다른 쪽이 바꾼 파일은 커밋 전체를 중단하지 않고 제외하고 경로를 기록
             
-            if result:
-                return True
-            else:
-                return False
+        Returns:
+            생성된 커밋 정보 또는 None
+        """
+        ref_url = f"{repo_url}/git/refs/heads/{branch}"
+        try:
+            for attempt in range(1, GITHUB_COMMIT_MAX_ATTEMPTS + 1):
+                # 브랜치 head 커밋과 그 tree 조회
+                response = self.session.get(ref_url)
+                response.raise_for_status()
+                head_sha = orjson.loads(response.content)['object']['sha']
                 
-        except Exception as e:
-            return False
+                response = self.session.get(f"{repo_url}/git/commits/{head_sha}")
+                response.raise_for_status()
+                head_commit = orjson.loads(response.content)
+                base_tree_sha = head_commit['tree']['sha']
+                
+                # 매 시도마다 새 base tree 기준으로 sha 확인 (조회 이후 다른 쪽이 바꾼 파일은 덮어쓰지 않음)
+                if conflicts is not None:
+                    conflicts.clear()
+                pending_updates = self._check_tree_shas(repo_url, base_tree_sha, file_updates, conflicts)
+                if pending_updates is None:
+                    return None
+                if not pending_updates:
+                    logger.debug(f"모든 파일이 이미 같은 내용으로 반영되어 있습니다: {repo_url} ({branch})")
+                    return head_commit
+                
+                tree_entries = [
+                    # 파일 내용을 tree 항목에 직접 넣어 blob 생성 요청을 생략
+                    {'path': update.file_path, 'mode': '100644', 'type': 'blob', 'content': update.content}
+                    for update in pending_updates
+                ]
+                tree = {'base_tree': base_tree_sha, 'tree': tree_entries}
+                response = self.session.post(f"{repo_url}/git/trees", data=orjson.dumps(tree), headers=JSON_CONTENT_HEADERS)
+                response.raise_for_status()
+                tree_sha = orjson.loads(response.content)['sha']
+                
+                message = commit_message if isinstance(commit_message, str) else commit_message(pending_updates)
+                commit = {'message': message, 'tree': tree_sha, 'parents': [head_sha]}
+                response = self.session.post(f"{repo_url}/git/commits", data=orjson.dumps(commit), headers=JSON_CONTENT_HEADERS)
+                response.raise_for_status()
+                commit_info = orjson.loads(response.content)
+                
+                # fast-forward만 허용 (그 사이 브랜치가 움직였으면 422 -> 새 head 기준으로 다시 커밋)
+                response = self.session.patch(ref_url, data=orjson.dumps({'sha': commit_info['sha']}), headers=JSON_CONTENT_HEADERS)
+                if response.status_code == 422 and attempt < GITHUB_COMMIT_MAX_ATTEMPTS:
+                    logger.warning(f"커밋 중 브랜치가 이동하여 새 head 기준으로 재시도 ({attempt}/{GITHUB_COMMIT_MAX_ATTEMPTS}): {repo_url} ({branch})")
+                    continue
+                response.raise_for_status()
+                
+                logger.info(f"{len(pending_updates)}개 파일 커밋 완료: {repo_url} ({branch}) - {commit_info['sha']}")
+                return commit_info
+            
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError, KeyError) as e:
+            logger.error(f"파일 일괄 커밋 실패: {repo_url} ({branch}) - {e}")
+            return None
+    
+    def _get_tree_blob_shas(self, repo_url: str, tree_sha: str) -> Dict[str, str]:
+        """tree의 파일 경로별 blob sha (재귀 조회)"""
+        response = self.session.get(f"{repo_url}/git/trees/{tree_sha}", params=RECURSIVE_TREE_PARAMS)
+        response.raise_for_status()
+        tree = orjson.loads(response.content)
+        if tree.get('truncated'):
+            # 일부 항목이 빠진 목록으로는 파일이 없는지 판단할 수 없음
+            raise requests.exceptions.RequestException(f"tree 목록이 잘려서 파일 sha를 확인할 수 없습니다: {tree_sha}")
+        return {entry['path']: entry['sha'] for entry in tree['tree'] if entry['type'] == 'blob'}
     
-    def _get_yaml_template_for_engine(self, run_id: str, experiment_id: str = "1", model_name: str = "Qwen/Qwen3-0.6B", version: str = "1", model_id: str = None, engine_type: str = None) -> Dict:
+    def _check_tree_shas(self, repo_url: str, tree_sha: str, file_updates: List[GitHubFileUpdate],
+                         conflicts: Optional[List[str]] = None) -> Optional[List[GitHubFileUpdate]]:
+        """
+        각 파일의 조회 시점 sha(새 파일은 None)가 base tree의 현재 blob sha와 같은지 확인
+        
+        Args:
+            conflicts: 주어지면 다른 쪽이 바꾼 파일은 제외하고 경로를 기록
+        
+        Returns:
+            커밋할 파일 목록 (이미 같은 내용인 파일은 제외), 다른 쪽이 바꾼 파일이 있고 conflicts가 없으면 None
+        """
+        blob_shas = self._get_tree_blob_shas(repo_url, tree_sha)
+        pending_updates = []
+        for update in file_updates:
+            current_sha = blob_shas.get(update.file_path)
+            if current_sha == update.sha:
+                pending_updates.append(update)
+            elif current_sha != git_blob_sha(update.content):
+                if conflicts is None:
+                    logger.warning(f"파일 sha 충돌, 다른 변경을 덮어쓰지 않도록 커밋 중단: {repo_url} - {update.file_path}")
+                    return None
+                logger.warning(f"파일 sha 충돌, 다른 변경을 덮어쓰지 않도록 커밋에서 제외: {repo_url} - {update.file_path}")
+                conflicts.append(update.file_path)
+        return pending_updates
+    
+    def _get_yaml_template_for_engine(self, run_id: str, experiment_id: str = "1", model_name: str = "Qwen/Qwen3-0.6B", version: str = "1", model_id: str = None, engine_type: str = None, timestamp: Optional[str] = None) -> Dict:
         """
         특정 엔진 타입에 대한 YAML 템플릿 생성
         
@@ -424,40 +943,43 @@ class GitHubClient:
             version: 모델 버전
             model_id: 모델 ID
             engine_type: 특정 엔진 타입 (vllm, tensorrt-llm)
+            timestamp: global.timestamp 값 (없으면 현재 시각)
             
         Returns:
             YAML 템플릿 딕셔너리
         """
+        if not engine_type or engine_type not in self.processors:
+            logger.error(f"지원하지 않는 엔진 타입: {engine_type}")
+            return None
+        
+        # 각 엔진별 템플릿 경로 생성
+        template_path = get_yaml_template_path(engine_type)
+        
+        # 템플릿 파일 가져오기 (디코딩된 내용, 캐시 사용)
+        content = self._get_template_text(self._template_contents_url, template_path)
+        
+        if content is None:
+            logger.error(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
+            return None
+        
+        # 템플릿 파일 내용 파싱 (프로세서가 수정하므로 매번 새로 파싱)
         try:
-            if not engine_type or engine_type not in self.processors:
-                logger.error(f"지원하지 않는 엔진 타입: {engine_type}")
-                return None
-            
-            # 각 엔진별 템플릿 경로 생성
-            template_path = get_yaml_template_path(engine_type)
-            
-            # 템플릿 파일 가져오기
-            template_file_info = self.get_template_file_content(template_path)
-            
-            if not template_file_info:
-                logger.error(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
-                return None
-            
-            # 템플릿 파일 내용 파싱
-            content = base64.b64decode(template_file_info['content']).decode('utf-8')
-            yaml_data = yaml.safe_load(content) or {}
-            logger.debug(f"템플릿 레포에서 {engine_type} 템플릿 파일 로드 완료: {template_path}")
-            
-            # 프로세서를 사용하여 YAML 처리
-            processor = self.processors[engine_type]
-            yaml_data = processor.process_yaml_data(yaml_data, model_name, run_id, experiment_id, model_id, version)
-            logger.debug(f"프로세서를 사용하여 YAML 처리 완료: {engine_type}")
-            
-            return yaml_data
-            
-        except Exception as e:
-            logger.error(f"엔진별 템플릿 로드 중 오류 발생: {e}")
+            yaml_data = yaml.load(content, Loader=YAMLLoader) or {}
+        except yaml.YAMLError as e:
+            logger.error(f"템플릿 YAML 파싱 실패: {template_path} - {e}")
             return None
+        logger.debug(f"템플릿 레포에서 {engine_type} 템플릿 파일 로드 완료: {template_path}")
+        
+        # 프로세서를 사용하여 YAML 처리 (템플릿 구조가 예상과 다르면 실패)
+        processor = self.processors[engine_type]
+        try:
+            yaml_data = processor.process_yaml_data(yaml_data, model_name, run_id, experiment_id, model_id, version, timestamp)
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.error(f"{engine_type} 템플릿 구조 처리 실패: {template_path} - {e}")
+            return None
+        logger.debug(f"프로세서를 사용하여 YAML 처리 완료: {engine_type}")
+        
+        return yaml_data
 
     def test_connection(self) -> bool:
         """
@@ -467,8 +989,11 @@ class GitHubClient:
             연결 성공 여부
         """
         try:
-            url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}"
-            response = requests.get(url, headers=self.headers)
+            # 상태 코드만 필요하므로 본문 없는 HEAD 사용 (HEAD를 거부하면 본문을 읽지 않는 GET)
+            response = self.session.head(self._repo_url, allow_redirects=True)
+            if response.status_code == 405:
+                response = self.session.get(self._repo_url, stream=True)
+                response.close()
             response.raise_for_status()
             
             logger.info(f"GitHub 연결 테스트 성공: {self.config.repo_owner}/{self.config.repo_name}")
@@ -486,12 +1011,22 @@ class GitHubClient:
             저장소 정보 딕셔너리 또는 None
         """
         try:
-            url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(self._repo_url)
             response.raise_for_status()
             
-            return response.json()
+            return orjson.loads(response.content)
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"저장소 정보 가져오기 실패: {e}")
-            return None 
\ No newline at end of file
+            return None 
+    
+    def close(self) -> None:
+        """스레드 풀과 세션의 연결 풀 정리"""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+    
+    def __enter__(self) -> "GitHubClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
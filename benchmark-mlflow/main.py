@@ -101,6 +101,8 @@ async def shutdown_event():
     if mlflow_manager:
         logger.info("MLflow Manager 종료 중...")
         mlflow_manager.stop_polling()
+        if mlflow_manager.github_client:
+            mlflow_manager.github_client.close()
         logger.info("MLflow Manager 종료 완료")
 
 # -----------------------------------------------------------------------------
@@ -6,7 +6,6 @@ import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from mlflow.tracking import MlflowClient
-import base64
 import yaml
 try:
     from mlflow.entities import ModelVersion, RegisteredModel
@@ -19,7 +18,8 @@ except ImportError:
         RegisteredModel = None
 
 from models import ModelEvent, PollingResult, GitHubConfig
-from github_client import GitHubClient
+from github_client import GitHubClient, YAMLLoader, LOOKUP_FAILED, decode_github_content
+from base_processor import deployment_timestamp
 from config import (BENCHMARK_EVAL_URL, ARGO_AUTO_DEPLOY, ARGOCD_PROJECT_NAME,
                     get_engines_to_process, get_yaml_model_file_path, ENGINE_NAMESPACE, ENGINE_PORT, EVALUATION_ENABLED)
 
@@ -49,6 +49,10 @@ class MLflowManager:
         if github_config:
             self.github_client = GitHubClient(github_config)
         
+        # 기존 모델 YAML의 blob sha -> global.modelid (global 섹션이 없으면 None)
+        # 파일이 바뀌지 않았으면(ETag 304) 폴링마다 base64 디코딩/YAML 파싱을 반복하지 않음
+        self._existing_model_ids: Dict[str, Optional[str]] = {}
+        
         # 폴링 제어용
         self._stop_event = threading.Event()
         self._polling_thread: Optional[threading.Thread] = None
@@ -60,6 +64,8 @@ class MLflowManager:
         new_versions = []
         existing_files = []
         engine_matches = []
+        # GitHub에서 확인할 (모델 버전, 엔진, 파일 경로) 목록
+        lookups = []
         try:
             registered_models = self.mlflow_client.search_registered_models()
             
@@ -81,8 +87,6 @@ class MLflowManager:
                             engines_to_check = get_engines_to_process()
                             
                             for engine_type in engines_to_check:
-                                existing_file = None
-                                
                                 engine_yaml_path = get_yaml_model_file_path(engine_type)
                                 
                                 if engine_yaml_path:
@@ -90,20 +94,24 @@ class MLflowManager:
                                 else:
                                     yaml_file_path = f"{model.name}.yaml"
                                 
-                                # 파일 존재 여부 확인
-                                engine_file = self.github_client.get_file_content(yaml_file_path)
-                                if engine_file:
-                                    logger.debug(f"기존 파일 발견: {yaml_file_path}")
-                                    existing_file = engine_file 
-
-                                engine_matches.append(engine_type)
-                                existing_files.append(existing_file)
-                                new_versions.append(latest_version)
+                                lookups.append((latest_version, engine_type, yaml_file_path))
 
                         logger.info(f"최신 모델 버전: {model.name}:{latest_version.version} (run_id: {latest_version.run_id})")
                             
                 except Exception as e:
                     logger.warning(f"모델 {model.name}의 버전 조회 실패: {e}")
+            
+            # 파일 존재 여부는 모든 모델/엔진에 대해 한 번에 동시에 확인
+            engine_files = self.github_client.get_file_contents([path for _, _, path in lookups]) if lookups else []
+            for (latest_version, engine_type, yaml_file_path), engine_file in zip(lookups, engine_files):
+                if engine_file is LOOKUP_FAILED:
+                    logger.warning(f"기존 파일 조회 실패, 이번 폴링에서 제외: {yaml_file_path}")
+                elif engine_file:
+                    logger.debug(f"기존 파일 발견: {yaml_file_path}")
+                
+                engine_matches.append(engine_type)
+                existing_files.append(engine_file)
+                new_versions.append(latest_version)
                     
         except Exception as e:
             logger.error(f"모델 버전 조회 실패: {e}")
@@ -130,6 +138,19 @@ class MLflowManager:
             logger.warning(f"source에서 model_id 추출 실패: {e}")
             return source
     
+    def _get_existing_model_id(self, existing_file: Dict, seen_model_ids: Dict[str, Optional[str]]) -> Optional[str]:
+        """기존 모델 YAML의 global.modelid 조회 (global 섹션이 없으면 None, 같은 blob sha는 캐시 사용)"""
+        sha = existing_file.get('sha')
+        if sha in self._existing_model_ids:
+            model_id = self._existing_model_ids[sha]
+        else:
+            content = decode_github_content(existing_file['content'])
+            yaml_data = yaml.load(content, Loader=YAMLLoader) or {}
+            model_id = yaml_data['global'].get('modelid', '') if 'global' in yaml_data else None
+        if sha:
+            seen_model_ids[sha] = model_id
+        return model_id
+    
     def _check_new_models(self) -> List[ModelEvent]:
         """새로운 모델 등록 확인 (GitHub 기반 - 단순화)"""
         # GitHub 기반 상태 관리에서는 모든 중복 체크가 _check_new_versions()에서 이루어지므로
@@ -154,17 +175,27 @@ class MLflowManager:
             # 각 모델의 최신 버전들 확인
             latest_versions, existing_files, engine_matches = self._get_latest_model_versions()
             
+            # 이번 폴링에서 갱신하는 모든 모델 YAML에 같은 timestamp 사용
+            timestamp = deployment_timestamp()
+            
+            # 모델 YAML을 갱신할 항목과 (버전, 엔진, 새 모델 여부) 목록
+            model_updates = []
+            changed = []
+            # 이번 폴링에서 확인한 파일만 캐시에 남김
+            seen_model_ids: Dict[str, Optional[str]] = {}
+            
             for version, existing_file, engine_match in zip(latest_versions, existing_files, engine_matches):
                 if not version.run_id:
                     continue
                 
+                # 조회 오류를 파일 없음으로 보면 새 모델로 잘못 생성/배포하므로 다음 폴링에서 다시 확인
+                if existing_file is LOOKUP_FAILED:
+                    continue
+                
                 if existing_file:
-                    content = base64.b64decode(existing_file['content']).decode('utf-8')
-                    yaml_data = yaml.safe_load(content) or {}
-                    
-                    if 'global' in yaml_data:
-                        existing_model_id = yaml_data['global'].get('modelid', '')
+                    existing_model_id = self._get_existing_model_id(existing_file, seen_model_ids)
                     
+                    if existing_model_id is not None:
                         # modelid가 같으면 스킵
                         current_model_id = self._extract_model_id_from_source(version.source)
                         if existing_model_id == current_model_id:
@@ -194,54 +225,61 @@ class MLflowManager:
                 else:
                     logger.debug(f"모델 업데이트 감지: {version.name}:{version.version} (run_id: {version.run_id})")
                 
-                # GitHub 레포 업데이트 (existing_file 정보 재사용)
+                # GitHub 레포 업데이트 정보 수집 (existing_file 정보 재사용)
                 try:
-                    # run_id에서 experiment_id 조회
-                    experiment_id = self._get_experiment_id_from_run(version.run_id)
+                    model_updates.append(dict(
+                        engine_type=engine_match,
+                        run_id=version.run_id,
+                        model_name=version.name,
+                        version=version.version,
+                        # run_id에서 experiment_id 조회
+                        experiment_id=self._get_experiment_id_from_run(version.run_id),
+                        # source에서 model_id 추출
+                        model_id=self._extract_model_id_from_source(version.source),
+                        existing_file=existing_file,  # 기존 파일 정보 전달
+                        timestamp=timestamp,
+                        # Argo 레포가 같은 레포면 AppProject/Application도 모델 YAML과 같은 커밋에 포함
+                        deploy_argo=ARGO_AUTO_DEPLOY and is_new
+                    ))
+                    changed.append((version, engine_match, is_new))
+                except Exception as e:
+                    logger.error(f"GitHub 업데이트 준비 중 오류: {e}")
+                    changed.append((version, engine_match, None))
+            
+            self._existing_model_ids = seen_model_ids
+            
+            # 변경된 모델 YAML은 모델마다 커밋하지 않고 한 커밋으로 반영
+            try:
+                update_results = iter(self.github_client.bulk_update_yaml_models(model_updates))
+            except Exception as e:
+                logger.error(f"GitHub 업데이트 중 오류: {e}")
+                update_results = iter([False] * len(model_updates))
+            
+            for version, engine_match, is_new in changed:
+                # is_new가 None이면 업데이트 준비 단계에서 실패한 모델
+                success = is_new is not None and next(update_results)
+                if success:
+                    logger.debug(f"GitHub 업데이트 성공: {version.name}:{version.version} (run_id: {version.run_id})")
                     
-                    # source에서 model_id 추출
-                    model_id = self._extract_model_id_from_source(version.source)
+                    # 새로운 모델인 경우 ArgoCD 프로젝트 생성
+                    if ARGO_AUTO_DEPLOY and is_new and self.github_client.argo_shares_repo:
+                        logger.info(f"ArgoCD 프로젝트/Application 생성/업데이트 성공 (모델 YAML과 같은 커밋): {ARGOCD_PROJECT_NAME} - {version.name}")
+                    elif ARGO_AUTO_DEPLOY and is_new:
+                        try:
+                            # AppProject와 Application을 하나의 커밋으로 생성/업데이트
+                            argo_success = self.github_client.deploy_model_to_argo(engine_match, version.name)
+                            if argo_success:
+                                logger.info(f"ArgoCD 프로젝트/Application 생성/업데이트 성공: {ARGOCD_PROJECT_NAME} - {version.name}")
+                            else:
+                                logger.error(f"ArgoCD 프로젝트/Application 생성 실패: {ARGOCD_PROJECT_NAME} - {version.name}")
+                        except Exception as e:
+                            logger.error(f"ArgoCD 프로젝트/Application 생성 중 오류: {ARGOCD_PROJECT_NAME} - {version.name} - {e}")
                     
-                    # update_yaml_models에 기존 파일 정보 전달하여 중복 호출 방지
-                    success = self.github_client.update_yaml_models(
-                        engine_match,
-                        version.run_id, 
-                        version.name, 
-                        version.version,
-                        experiment_id,
-                        model_id,
-                        existing_file  # 기존 파일 정보 전달
-                    )
-                    if success:
-                        logger.debug(f"GitHub 업데이트 성공: {version.name}:{version.version} (run_id: {version.run_id})")
-                        
-                        # 새로운 모델인 경우 ArgoCD 프로젝트 생성
-                        if ARGO_AUTO_DEPLOY and is_new:
-                            try:
-                                project_success = self.github_client.create_argo_project()
-                                if project_success:
-                                    logger.info(f"ArgoCD 프로젝트 생성/업데이트 성공: {ARGOCD_PROJECT_NAME}")
-                                    try:
-                                        argo_success = self.github_client.add_model_to_argo_application(engine_match, version.name)
-                                        if argo_success:
-                                            logger.info(f"ArgoCD Application 생성/업데이트 성공: {ARGOCD_PROJECT_NAME} - {version.name}")
-                                        else:
-                                            logger.error(f"ArgoCD Application 생성 실패: {ARGOCD_PROJECT_NAME} - {version.name}")
-                                    except Exception as e:
-                                        logger.error(f"ArgoCD Application 생성 중 오류: {ARGOCD_PROJECT_NAME} - {version.name} - {e}")
-                                else:
-                                    logger.error(f"ArgoCD 프로젝트 생성 실패: {ARGOCD_PROJECT_NAME}")
-                            except Exception as e:
-                                logger.error(f"ArgoCD 프로젝트 생성 중 오류: {ARGOCD_PROJECT_NAME} - {e}")
-                            
-                            
-                        elif not ARGO_AUTO_DEPLOY:
-                            logger.info(f"ARGO_AUTO_DEPLOY가 비활성화되어 {ARGOCD_PROJECT_NAME}의 {version.name}의 ArgoCD 프로젝트 생성을 건너뜁니다.")
-
-                    else:
-                        logger.error(f"GitHub 업데이트 실패: {version.name}:{version.version} (run_id: {version.run_id})")
-                except Exception as e:
-                    logger.error(f"GitHub 업데이트 중 오류: {e}")
+                    elif not ARGO_AUTO_DEPLOY:
+                        logger.info(f"ARGO_AUTO_DEPLOY가 비활성화되어 {ARGOCD_PROJECT_NAME}의 {version.name}의 ArgoCD 프로젝트 생성을 건너뜁니다.")
+                
+                else:
+                    logger.error(f"GitHub 업데이트 실패: {version.name}:{version.version} (run_id: {version.run_id})")
                 
                 if EVALUATION_ENABLED:
                     try:
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from base_processor import BaseYAMLProcessor
 
 logger = logging.getLogger(__name__)
@@ -10,13 +10,13 @@ class TensorRTLLMProcessor(BaseYAMLProcessor):
     
     def process_yaml_data(self, yaml_data: Dict[str, Any], model_name: str,
                          run_id: str, experiment_id: str, model_id: str,
-                         version: str) -> Dict[str, Any]:
+                         version: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         TensorRT-LLM용 YAML 데이터 처리
         """
         try:
             # Global 섹션 업데이트
-            self._update_global_section(yaml_data, model_name, run_id, experiment_id, model_id, version)
+            self._update_global_section(yaml_data, model_name, run_id, experiment_id, model_id, version, timestamp)
             
             # 모델명을 k8s 호환 형태로 변환
             model_name_k8s = self._get_model_name_k8s(model_name)